@@ -9,6 +9,18 @@ from pathlib import Path
 ASK_DB_PATH: str = os.getenv("ASK_DB_PATH", "/data/ask.db")
 DEFAULT_STARTING_POINTS: int = int(os.getenv("DEFAULT_STARTING_POINTS", "10"))
 POINTS_PER_QUESTION: int = int(os.getenv("POINTS_PER_QUESTION", "1"))
+ASK_DB_SYNCHRONOUS: str = os.getenv("ASK_DB_SYNCHRONOUS", "NORMAL").strip().upper()
+ASK_DB_BUSY_TIMEOUT_MS: int = int(os.getenv("ASK_DB_BUSY_TIMEOUT_MS", "5000"))
+ASK_DB_CACHE_SIZE_KIB: int = int(os.getenv("ASK_DB_CACHE_SIZE_KIB", "20000"))
+ASK_DB_MMAP_SIZE_BYTES: int = int(os.getenv("ASK_DB_MMAP_SIZE_BYTES", str(256 * 1024 * 1024)))
+# sqlite3 reuses prepared statements per connection keyed by the SQL text;
+# room for every distinct Ask query so hot lookups never re-prepare.
+ASK_DB_CACHED_STATEMENTS: int = 256
+
+# Bump when _migrate_questions_table gains new steps; recorded in PRAGMA user_version.
+ASK_SCHEMA_VERSION = 1
+
+_SYNCHRONOUS_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
 
 _local = threading.local()
 
@@ -54,6 +66,9 @@ CREATE INDEX IF NOT EXISTS idx_questions_status ON questions(status);
 
 def _migrate_questions_table(conn: sqlite3.Connection) -> None:
     """Add newly introduced Ask columns/indexes without breaking existing DBs."""
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= ASK_SCHEMA_VERSION:
+        return
+
     question_columns = {
         row["name"]
         for row in conn.execute("PRAGMA table_info(questions)").fetchall()
@@ -99,6 +114,18 @@ def _migrate_questions_table(conn: sqlite3.Connection) -> None:
         "CREATE INDEX IF NOT EXISTS idx_questions_openai_deadline_at "
         "ON questions(openai_deadline_at)"
     )
+    conn.execute(f"PRAGMA user_version={ASK_SCHEMA_VERSION}")
+
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    # NORMAL is durable across app crashes in WAL mode and skips the
+    # per-commit fsync; busy_timeout retries instead of "database is locked".
+    synchronous = ASK_DB_SYNCHRONOUS if ASK_DB_SYNCHRONOUS in _SYNCHRONOUS_MODES else "NORMAL"
+    conn.execute(f"PRAGMA synchronous={synchronous}")
+    conn.execute(f"PRAGMA busy_timeout={max(0, ASK_DB_BUSY_TIMEOUT_MS)}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA cache_size=-{max(0, ASK_DB_CACHE_SIZE_KIB)}")
+    conn.execute(f"PRAGMA mmap_size={max(0, ASK_DB_MMAP_SIZE_BYTES)}")
 
 
 def _get_connection() -> sqlite3.Connection:
@@ -106,14 +133,42 @@ def _get_connection() -> sqlite3.Connection:
     conn = getattr(_local, "conn", None)
     if conn is None:
         Path(ASK_DB_PATH).parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(ASK_DB_PATH, check_same_thread=False)
+        conn = sqlite3.connect(ASK_DB_PATH, check_same_thread=False, cached_statements=ASK_DB_CACHED_STATEMENTS)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA foreign_keys=ON")
+        _apply_pragmas(conn)
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
         _local.conn = conn
     return conn
 
 
+def _get_read_connection() -> sqlite3.Connection:
+    """Return a thread-local read-only SQLite connection.
+
+    Readers never take the write lock, so under WAL they proceed while the
+    thread-local read/write connections commit.
+    """
+    conn = getattr(_local, "read_conn", None)
+    if conn is not None and getattr(_local, "read_conn_path", None) != ASK_DB_PATH:
+        conn.close()
+        conn = None
+    if conn is None:
+        db_uri = Path(ASK_DB_PATH).resolve().as_uri()
+        conn = sqlite3.connect(
+            f"{db_uri}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=ASK_DB_CACHED_STATEMENTS,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only=1")
+        _apply_pragmas(conn)
+        _local.read_conn = conn
+        _local.read_conn_path = ASK_DB_PATH
+    return conn
+
+
 def init_db() -> None:
     """Create tables if they don't exist."""
     conn = _get_connection()
@@ -127,11 +182,33 @@ def init_db() -> None:
 
 
 @contextmanager
-def get_db():
-    """Yield a SQLite connection for use in a request context."""
+def get_db(*, readonly: bool = False):
+    """Yield a SQLite connection for use in a request context.
+
+    Pass ``readonly=True`` for pure SELECTs to use the read-only connection.
+    """
+    conn = _get_read_connection() if readonly else _get_connection()
+    try:
+        yield conn
+    except Exception:
+        conn.rollback()
+        raise
+
+
+@contextmanager
+def batched_writes():
+    """Yield the read/write connection inside a single ``BEGIN IMMEDIATE`` transaction.
+
+    Everything executed in the block shares one commit (one WAL sync), and the
+    write lock is taken up front so read-then-write sequences cannot fail on a
+    lock upgrade.
+    """
     conn = _get_connection()
+    conn.execute("BEGIN IMMEDIATE")
     try:
         yield conn
     except Exception:
         conn.rollback()
         raise
+    else:
+        conn.commit()
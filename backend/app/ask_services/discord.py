@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 import logging
 import os
+import time
+from typing import Awaitable, Callable
 import urllib.parse
 
 import httpx
 
+from app.async_utils import LoopSemaphore
 from app.env_utils import get_env
-from app.log_redact import httpx_event_hooks
+from app.http_client import get_client
 
 logger = logging.getLogger("marcle.ask.discord")
 
@@ -19,9 +23,24 @@ DISCORD_BOT_TOKEN: str = get_env("DISCORD_BOT_TOKEN", "")
 DISCORD_ASK_CHANNEL_ID: str = os.getenv("DISCORD_ASK_CHANNEL_ID", "")
 DISCORD_GUILD_ID: str = os.getenv("DISCORD_GUILD_ID", "")
 DISCORD_API_BASE: str = os.getenv("DISCORD_API_BASE", "https://discord.com/api/v10")
+DISCORD_TIMEOUT = httpx.Timeout(timeout=15.0)
+THREAD_CACHE_TTL_SECONDS = 60.0
+DISCORD_MAX_CONCURRENT_POSTS = 8
+DISCORD_MAX_RATE_LIMIT_WAIT_SECONDS = 5.0
 
+# Bounds concurrent question posts; when Discord reports an exhausted rate-limit
+# bucket, later requests wait out the reset instead of collecting 429s.
+_post_semaphore = LoopSemaphore(DISCORD_MAX_CONCURRENT_POSTS)
+_rate_limited_until = 0.0
 
-@dataclass
+# Thread lookups/creations keyed by (channel_id, message_id): resolved ids are
+# remembered briefly and concurrent callers share one in-flight request.
+_thread_cache: dict[tuple[str, str], tuple[float, str]] = {}
+_thread_lookups: dict[tuple[str, str], asyncio.Task] = {}
+_thread_creations: dict[tuple[str, str], asyncio.Task] = {}
+
+
+@dataclass(slots=True, frozen=True)
 class DiscordQuestionPostResult:
     delivered: bool
     guild_id: str | None = None
@@ -38,11 +57,42 @@ def _webhook_wait_url(webhook_url: str) -> str:
     return urllib.parse.urlunparse(parsed._replace(query=new_query))
 
 
-def _bot_headers() -> dict[str, str]:
-    return {
-        "Authorization": f"Bot {DISCORD_BOT_TOKEN}",
-        "Content-Type": "application/json",
-    }
+# Derived from module constants once instead of per post.
+_WEBHOOK_WAIT_URL: str = _webhook_wait_url(DISCORD_WEBHOOK_URL) if DISCORD_WEBHOOK_URL else ""
+_DISCORD_API_ROOT: str = DISCORD_API_BASE.rstrip("/")
+_BOT_CHANNEL_MESSAGES_URL: str = f"{_DISCORD_API_ROOT}/channels/{DISCORD_ASK_CHANNEL_ID}/messages"
+_BOT_HEADERS: dict[str, str] = {
+    "Authorization": f"Bot {DISCORD_BOT_TOKEN}",
+    "Content-Type": "application/json",
+}
+
+
+def _nonempty_id(value: object) -> str | None:
+    if not value:
+        return None
+    text = value if isinstance(value, str) else str(value)
+    return text.strip() or None
+
+
+def _note_rate_limit(resp: httpx.Response) -> None:
+    global _rate_limited_until
+    if resp.headers.get("X-RateLimit-Remaining") != "0":
+        return
+    try:
+        reset_after = float(resp.headers.get("X-RateLimit-Reset-After", "0"))
+    except ValueError:
+        return
+    wait_seconds = min(max(reset_after, 0.0), DISCORD_MAX_RATE_LIMIT_WAIT_SECONDS)
+    _rate_limited_until = max(_rate_limited_until, time.monotonic() + wait_seconds)
+
+
+async def _discord_request(client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+    delay = _rate_limited_until - time.monotonic()
+    if delay > 0:
+        await asyncio.sleep(delay)
+    resp = await client.request(method, url, timeout=DISCORD_TIMEOUT, **kwargs)
+    _note_rate_limit(resp)
+    return resp
 
 
 def _question_embed(*, question_id: int, user_name: str, user_email: str, question_text: str) -> dict:
@@ -59,15 +109,60 @@ def _question_embed(*, question_id: int, user_name: str, user_email: str, questi
     }
 
 
+def _cached_thread_id(key: tuple[str, str]) -> str | None:
+    cached = _thread_cache.get(key)
+    if cached is None:
+        return None
+    if time.monotonic() - cached[0] >= THREAD_CACHE_TTL_SECONDS:
+        _thread_cache.pop(key, None)
+        return None
+    return cached[1]
+
+
+async def _single_flight_thread_id(
+    inflight: dict[tuple[str, str], asyncio.Task],
+    key: tuple[str, str],
+    factory: Callable[[], Awaitable[str | None]],
+) -> str | None:
+    cached = _cached_thread_id(key)
+    if cached is not None:
+        return cached
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(factory())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    thread_id = await asyncio.shield(task)
+    if thread_id:
+        now = time.monotonic()
+        for stale_key in [k for k, (ts, _) in _thread_cache.items() if now - ts >= THREAD_CACHE_TTL_SECONDS]:
+            del _thread_cache[stale_key]
+        _thread_cache[key] = (now, thread_id)
+    return thread_id
+
+
 async def _fetch_message_thread_id(
     *,
     client: httpx.AsyncClient,
     channel_id: str,
     message_id: str,
 ) -> str | None:
-    url = f"{DISCORD_API_BASE.rstrip('/')}/channels/{channel_id}/messages/{message_id}"
+    return await _single_flight_thread_id(
+        _thread_lookups,
+        (channel_id, message_id),
+        lambda: _request_message_thread_id(client=client, channel_id=channel_id, message_id=message_id),
+    )
+
+
+async def _request_message_thread_id(
+    *,
+    client: httpx.AsyncClient,
+    channel_id: str,
+    message_id: str,
+) -> str | None:
+    url = f"{_DISCORD_API_ROOT}/channels/{channel_id}/messages/{message_id}"
     try:
-        resp = await client.get(url, headers=_bot_headers())
+        resp = await _discord_request(client, "GET", url, headers=_BOT_HEADERS)
         if resp.status_code >= 400:
             return None
         body = resp.json() if resp.content else {}
@@ -88,19 +183,40 @@ async def _create_discord_thread(
 ) -> str | None:
     if not DISCORD_BOT_TOKEN:
         return None
-    url = f"{DISCORD_API_BASE.rstrip('/')}/channels/{channel_id}/messages/{message_id}/threads"
+    return await _single_flight_thread_id(
+        _thread_creations,
+        (channel_id, message_id),
+        lambda: _request_discord_thread(
+            client=client,
+            channel_id=channel_id,
+            message_id=message_id,
+            question_id=question_id,
+        ),
+    )
+
+
+async def _request_discord_thread(
+    *,
+    client: httpx.AsyncClient,
+    channel_id: str,
+    message_id: str,
+    question_id: int,
+) -> str | None:
+    url = f"{_DISCORD_API_ROOT}/channels/{channel_id}/messages/{message_id}/threads"
     payload = {
         "name": f"Ask #{question_id}",
         "auto_archive_duration": 1440,
     }
     try:
-        resp = await client.post(url, json=payload, headers=_bot_headers())
+        resp = await _discord_request(client, "POST", url, json=payload, headers=_BOT_HEADERS)
         if resp.status_code >= 400:
             body: dict = {}
-            try:
-                body = resp.json() if resp.content else {}
-            except ValueError:
-                body = {}
+            # Only the "thread already exists" error body is worth decoding.
+            if b"160004" in resp.content:
+                try:
+                    body = resp.json()
+                except ValueError:
+                    body = {}
             if body.get("code") == 160004:
                 # Thread already exists for this message. Reuse it.
                 return await _fetch_message_thread_id(
@@ -131,7 +247,6 @@ async def _post_question_via_bot(
     user_email: str,
     question_text: str,
 ) -> DiscordQuestionPostResult:
-    url = f"{DISCORD_API_BASE.rstrip('/')}/channels/{DISCORD_ASK_CHANNEL_ID}/messages"
     payload = {
         "content": f"New Ask question #{question_id}",
         "embeds": [
@@ -144,7 +259,7 @@ async def _post_question_via_bot(
         ],
         "allowed_mentions": {"parse": []},
     }
-    resp = await client.post(url, json=payload, headers=_bot_headers())
+    resp = await _discord_request(client, "POST", _BOT_CHANNEL_MESSAGES_URL, json=payload, headers=_BOT_HEADERS)
     if resp.status_code >= 400:
         logger.warning(
             "Failed to post Ask question via bot status=%d body=%s",
@@ -154,9 +269,9 @@ async def _post_question_via_bot(
         return DiscordQuestionPostResult(delivered=False)
 
     body = resp.json() if resp.content else {}
-    message_id = str(body.get("id") or "").strip() or None
-    channel_id = str(body.get("channel_id") or DISCORD_ASK_CHANNEL_ID).strip() or None
-    guild_id = str(body.get("guild_id") or DISCORD_GUILD_ID).strip() or None
+    message_id = _nonempty_id(body.get("id"))
+    channel_id = _nonempty_id(body.get("channel_id") or DISCORD_ASK_CHANNEL_ID)
+    guild_id = _nonempty_id(body.get("guild_id") or DISCORD_GUILD_ID)
     thread_id = None
     if channel_id and message_id:
         thread_id = await _create_discord_thread(
@@ -192,12 +307,12 @@ async def _post_question_via_webhook(
             )
         ],
     }
-    resp = await client.post(_webhook_wait_url(DISCORD_WEBHOOK_URL), json=payload)
+    resp = await _discord_request(client, "POST", _WEBHOOK_WAIT_URL, json=payload)
     resp.raise_for_status()
     body = resp.json() if resp.content else {}
-    message_id = str(body.get("id") or "").strip() or None
-    channel_id = str(body.get("channel_id") or "").strip() or None
-    guild_id = str(body.get("guild_id") or DISCORD_GUILD_ID).strip() or None
+    message_id = _nonempty_id(body.get("id"))
+    channel_id = _nonempty_id(body.get("channel_id"))
+    guild_id = _nonempty_id(body.get("guild_id") or DISCORD_GUILD_ID)
     thread_id = None
     if DISCORD_BOT_TOKEN and channel_id and message_id:
         thread_id = await _create_discord_thread(
@@ -223,7 +338,8 @@ async def post_question_to_discord(
     question_text: str,
 ) -> DiscordQuestionPostResult:
     """Post a new Ask question and create a per-question thread when possible."""
-    async with httpx.AsyncClient(timeout=15.0, event_hooks=httpx_event_hooks()) as client:
+    async with _post_semaphore:
+        client = get_client()
         if DISCORD_BOT_TOKEN and DISCORD_ASK_CHANNEL_ID:
             try:
                 result = await _post_question_via_bot(
@@ -1,12 +1,19 @@
 """Email service for sending answers to users."""
 
+import html
+import asyncio
+import functools
 import logging
 import os
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+from email import policy
+from email.message import EmailMessage
 
-from app.env_utils import get_env
+from app.env_utils import TRUTHY_ENV_VALUES, get_env
 
 logger = logging.getLogger("marcle.ask.email")
 
@@ -15,7 +22,58 @@ SMTP_PORT: int = int(os.getenv("SMTP_PORT", "587"))
 SMTP_USER: str = get_env("SMTP_USER", "")
 SMTP_PASS: str = get_env("SMTP_PASS", "")
 SMTP_FROM: str = os.getenv("SMTP_FROM", "")
-SMTP_USE_TLS: bool = os.getenv("SMTP_USE_TLS", "true").lower() in {"1", "true", "yes", "on"}
+
+SMTP_USE_TLS: bool = os.getenv("SMTP_USE_TLS", "true").strip().lower() in TRUTHY_ENV_VALUES
+SMTP_TIMEOUT_SECONDS: float = float(os.getenv("SMTP_TIMEOUT_SECONDS", "20"))
+SMTP_SESSION_IDLE_SECONDS: float = float(os.getenv("SMTP_SESSION_IDLE_SECONDS", "60"))
+SMTP_MAX_CONNECTIONS: int = max(1, int(os.getenv("SMTP_MAX_CONNECTIONS", "4")))
+
+
+# Answer email bodies are module constants; send_answer_email only fills the
+# dynamic fields with str.format.
+_ANSWER_TEXT_TEMPLATE = (
+    "Hi {to_name},\n\n"
+    "Your question has been answered!\n\n"
+    "--- Your Question ---\n{question_text}\n\n"
+    "--- Answer ---\n{answer_text}\n\n"
+    "Thanks for using marcle.ai!\n"
+    "— Marc\n"
+)
+_ANSWER_HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"></head>
+<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; color: #e5ecf5; background: #0c1117;">
+  <div style="background: #161b22; border-radius: 12px; padding: 24px; border: 1px solid rgba(255,255,255,0.08);">
+    <h2 style="color: #4ade80; margin-top: 0;">Your Question Has Been Answered!</h2>
+    <p style="color: #8b949e;">Hi {to_name},</p>
+
+    <div style="background: #0d1117; border-radius: 8px; padding: 16px; margin: 16px 0; border-left: 3px solid #5865F2;">
+      <p style="color: #8b949e; margin: 0 0 4px 0; font-size: 12px; text-transform: uppercase;">Your Question</p>
+      <p style="color: #e5ecf5; margin: 0;">{question_text}</p>
+    </div>
+
+    <div style="background: #0d1117; border-radius: 8px; padding: 16px; margin: 16px 0; border-left: 3px solid #4ade80;">
+      <p style="color: #8b949e; margin: 0 0 4px 0; font-size: 12px; text-transform: uppercase;">Answer</p>
+      <p style="color: #e5ecf5; margin: 0;">{answer_text}</p>
+    </div>
+
+    <p style="color: #8b949e; margin-bottom: 0;">Thanks for using marcle.ai!<br>&mdash; Marc</p>
+  </div>
+</body>
+</html>"""
+
+
+def _html_transfer_encoding(html_body: str) -> str | None:
+    # ASCII with every line within policy.max_line_length goes out as 7bit.
+    # Past that, the email package test-encodes a sample as both
+    # quoted-printable and base64 before picking one; for ASCII markup that is
+    # quoted-printable, so name it up front. Non-ASCII keeps the heuristic.
+    if not html_body.isascii():
+        return None
+    max_line_length = policy.default.max_line_length
+    if any(len(line) > max_line_length for line in html_body.splitlines()):
+        return "quoted-printable"
+    return None
 
 
 def _validate_email_config() -> tuple[bool, str | None]:
@@ -33,6 +91,139 @@ def _validate_email_config() -> tuple[bool, str | None]:
     return True, None
 
 
+class _SmtpSession:
+    """One authenticated SMTP connection reused across sends from one worker.
+
+    EHLO, STARTTLS and AUTH run once per connection, so a steady-state send is
+    just the mail transaction. The connection is dropped after
+    SMTP_SESSION_IDLE_SECONDS without use; if a reused connection turns out to
+    be dead, the message is retried once on a fresh one. Sends are serialized
+    because an SMTP session handles one transaction at a time.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._server: smtplib.SMTP | None = None
+        self._key: tuple | None = None
+        self._last_used = 0.0
+
+    def send(self, msg: EmailMessage) -> None:
+        key = (SMTP_HOST, SMTP_PORT, SMTP_USE_TLS, SMTP_USER, SMTP_PASS)
+        with self._lock:
+            server = self._reusable_server_unlocked(key)
+            if server is not None:
+                try:
+                    server.send_message(msg)
+                except Exception as exc:
+                    self._close_unlocked()
+                    if not _is_stale_connection_error(exc):
+                        raise
+                    logger.info("ask_email_smtp_reconnect reason=%s", exc.__class__.__name__)
+                else:
+                    self._last_used = time.monotonic()
+                    return
+
+            server = self._connect_unlocked(key)
+            try:
+                server.send_message(msg)
+            except Exception:
+                self._close_unlocked()
+                raise
+            self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_unlocked()
+
+    def _reusable_server_unlocked(self, key: tuple) -> smtplib.SMTP | None:
+        server = self._server
+        if server is None:
+            return None
+        if self._key != key or time.monotonic() - self._last_used >= SMTP_SESSION_IDLE_SECONDS:
+            self._close_unlocked()
+            return None
+        return server
+
+    def _connect_unlocked(self, key: tuple) -> smtplib.SMTP:
+        server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT_SECONDS)
+        try:
+            # starttls() and login() send EHLO themselves when it is still needed.
+            if SMTP_USE_TLS:
+                server.starttls()
+            server.login(SMTP_USER, SMTP_PASS)
+        except Exception:
+            _quit_quietly(server)
+            raise
+        self._server = server
+        self._key = key
+        return server
+
+    def _close_unlocked(self) -> None:
+        server = self._server
+        self._server = None
+        self._key = None
+        if server is not None:
+            _quit_quietly(server)
+
+
+def _is_stale_connection_error(exc: Exception) -> bool:
+    # A relay that timed out an idle session either drops the socket or answers
+    # the next command with 421; in both cases nothing was accepted.
+    if isinstance(exc, smtplib.SMTPServerDisconnected):
+        return True
+    return isinstance(exc, smtplib.SMTPResponseException) and exc.smtp_code == 421
+
+
+def _quit_quietly(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except Exception:
+        try:
+            server.close()
+        except Exception:
+            pass
+
+
+# Each SMTP worker thread owns one session, so up to SMTP_MAX_CONNECTIONS
+# messages are in flight at once over that many long-lived connections.
+_thread_state = threading.local()
+_sessions: list[_SmtpSession] = []
+_sessions_lock = threading.Lock()
+
+
+def _current_session() -> _SmtpSession:
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = _SmtpSession()
+        _thread_state.session = session
+        with _sessions_lock:
+            _sessions.append(session)
+    return session
+
+
+# SMTP work runs on its own threads so a slow relay never occupies the default
+# executor that serves asyncio.to_thread DB calls. The executor's work queue
+# buffers bursts of answers; idle threads are reused first, so light traffic
+# stays on a single connection.
+_smtp_executor = ThreadPoolExecutor(max_workers=SMTP_MAX_CONNECTIONS, thread_name_prefix="ask-smtp")
+
+_T = TypeVar("_T")
+
+
+async def run_in_smtp_executor(func: Callable[..., _T], /, **kwargs: Any) -> _T:
+    """Run a blocking email helper on an SMTP thread without blocking the loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_smtp_executor, functools.partial(func, **kwargs))
+
+
+def close_smtp_session() -> None:
+    """Close every pooled SMTP connection, if any."""
+    with _sessions_lock:
+        sessions = list(_sessions)
+    for session in sessions:
+        session.close()
+
+
 def send_custom_email_result(
     *,
     to_email: str,
@@ -53,26 +244,15 @@ def send_custom_email_result(
         )
         return False, config_error
 
-    msg = MIMEMultipart("alternative")
+    msg = EmailMessage()
     msg["Subject"] = subject
     msg["From"] = SMTP_FROM
     msg["To"] = to_email
-    msg.attach(MIMEText(text_body, "plain"))
-    msg.attach(MIMEText(html_body, "html"))
+    msg.set_content(text_body)
+    msg.add_alternative(html_body, subtype="html", cte=_html_transfer_encoding(html_body))
 
     try:
-        if SMTP_USE_TLS:
-            with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
-                server.login(SMTP_USER, SMTP_PASS)
-                server.send_message(msg)
-        else:
-            with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-                server.login(SMTP_USER, SMTP_PASS)
-                server.send_message(msg)
-
+        _current_session().send(msg)
         logger.info(
             "ask_email_send_success recipient=%s question_id=%s context=%s",
             to_email,
@@ -124,40 +304,16 @@ def send_answer_email(
 ) -> bool:
     """Send the answer to the user via SMTP. Returns True on success."""
     subject = f"Your question on marcle.ai has been answered (#{question_id})"
-
-    # Plain text body
-    text_body = (
-        f"Hi {to_name},\n\n"
-        f"Your question has been answered!\n\n"
-        f"--- Your Question ---\n{question_text}\n\n"
-        f"--- Answer ---\n{answer_text}\n\n"
-        f"Thanks for using marcle.ai!\n"
-        f"— Marc\n"
+    text_body = _ANSWER_TEXT_TEMPLATE.format(
+        to_name=to_name,
+        question_text=question_text,
+        answer_text=answer_text,
+    )
+    html_body = _ANSWER_HTML_TEMPLATE.format(
+        to_name=html.escape(to_name),
+        question_text=html.escape(question_text).replace("\n", "<br>"),
+        answer_text=html.escape(answer_text).replace("\n", "<br>"),
     )
-
-    # HTML body
-    html_body = f"""<!DOCTYPE html>
-<html>
-<head><meta charset="utf-8"></head>
-<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; color: #e5ecf5; background: #0c1117;">
-  <div style="background: #161b22; border-radius: 12px; padding: 24px; border: 1px solid rgba(255,255,255,0.08);">
-    <h2 style="color: #4ade80; margin-top: 0;">Your Question Has Been Answered!</h2>
-    <p style="color: #8b949e;">Hi {to_name},</p>
-
-    <div style="background: #0d1117; border-radius: 8px; padding: 16px; margin: 16px 0; border-left: 3px solid #5865F2;">
-      <p style="color: #8b949e; margin: 0 0 4px 0; font-size: 12px; text-transform: uppercase;">Your Question</p>
-      <p style="color: #e5ecf5; margin: 0;">{question_text}</p>
-    </div>
-
-    <div style="background: #0d1117; border-radius: 8px; padding: 16px; margin: 16px 0; border-left: 3px solid #4ade80;">
-      <p style="color: #8b949e; margin: 0 0 4px 0; font-size: 12px; text-transform: uppercase;">Answer</p>
-      <p style="color: #e5ecf5; margin: 0;">{answer_text}</p>
-    </div>
-
-    <p style="color: #8b949e; margin-bottom: 0;">Thanks for using marcle.ai!<br>&mdash; Marc</p>
-  </div>
-</body>
-</html>"""
 
     return send_custom_email(
         to_email=to_email,
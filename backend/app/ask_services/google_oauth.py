@@ -6,7 +6,7 @@ import urllib.parse
 import httpx
 
 from app.env_utils import get_env
-from app.log_redact import httpx_event_hooks
+from app.http_client import get_client
 
 GOOGLE_CLIENT_ID: str = os.getenv("GOOGLE_CLIENT_ID", "")
 GOOGLE_CLIENT_SECRET: str = get_env("GOOGLE_CLIENT_SECRET", "")
@@ -17,45 +17,53 @@ GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 GOOGLE_USERINFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
 
 SCOPES = "openid email profile"
+GOOGLE_TIMEOUT = httpx.Timeout(timeout=10.0)
 
 
-def get_login_url(state: str, redirect_uri: str) -> str:
-    """Build the Google OAuth2 authorization URL."""
-    params = {
+# Only redirect_uri and state vary per login; the rest of the query is fixed.
+_LOGIN_URL_PREFIX = f"{GOOGLE_AUTH_URL}?" + urllib.parse.urlencode(
+    {
         "client_id": GOOGLE_CLIENT_ID,
-        "redirect_uri": redirect_uri,
         "response_type": "code",
         "scope": SCOPES,
         "access_type": "offline",
-        "state": state,
         "prompt": "consent",
     }
-    return f"{GOOGLE_AUTH_URL}?{urllib.parse.urlencode(params)}"
+)
+
+
+def get_login_url(state: str, redirect_uri: str) -> str:
+    """Build the Google OAuth2 authorization URL."""
+    return (
+        f"{_LOGIN_URL_PREFIX}"
+        f"&redirect_uri={urllib.parse.quote_plus(redirect_uri)}"
+        f"&state={urllib.parse.quote_plus(state)}"
+    )
 
 
 async def exchange_code(code: str, redirect_uri: str) -> dict:
     """Exchange authorization code for tokens."""
-    async with httpx.AsyncClient(timeout=10.0, event_hooks=httpx_event_hooks()) as client:
-        resp = await client.post(
-            GOOGLE_TOKEN_URL,
-            data={
-                "code": code,
-                "client_id": GOOGLE_CLIENT_ID,
-                "client_secret": GOOGLE_CLIENT_SECRET,
-                "redirect_uri": redirect_uri,
-                "grant_type": "authorization_code",
-            },
-        )
-        resp.raise_for_status()
-        return resp.json()
+    resp = await get_client().post(
+        GOOGLE_TOKEN_URL,
+        data={
+            "code": code,
+            "client_id": GOOGLE_CLIENT_ID,
+            "client_secret": GOOGLE_CLIENT_SECRET,
+            "redirect_uri": redirect_uri,
+            "grant_type": "authorization_code",
+        },
+        timeout=GOOGLE_TIMEOUT,
+    )
+    resp.raise_for_status()
+    return resp.json()
 
 
 async def get_user_info(access_token: str) -> dict:
     """Fetch user profile from Google."""
-    async with httpx.AsyncClient(timeout=10.0, event_hooks=httpx_event_hooks()) as client:
-        resp = await client.get(
-            GOOGLE_USERINFO_URL,
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-        resp.raise_for_status()
-        return resp.json()
+    resp = await get_client().get(
+        GOOGLE_USERINFO_URL,
+        headers={"Authorization": f"Bearer {access_token}"},
+        timeout=GOOGLE_TIMEOUT,
+    )
+    resp.raise_for_status()
+    return resp.json()
@@ -6,18 +6,27 @@ import os
 import re
 
 from app.ask_services.llm_client import call_openai_compatible
+from app.async_utils import LoopSemaphore
 from app.env_utils import get_env
 
-LOCAL_LLM_BASE_URL: str = os.getenv("LOCAL_LLM_BASE_URL", "http://172.16.2.220:12434/engines/v1")
-LOCAL_LLM_API_KEY: str = get_env("LOCAL_LLM_API_KEY", "not-needed")
-LOCAL_LLM_MODEL: str = os.getenv("LOCAL_LLM_MODEL", "ai/llama3.2:latest")
+# Provider settings are stripped once here so the request path can use them as-is.
+LOCAL_LLM_BASE_URL: str = os.getenv("LOCAL_LLM_BASE_URL", "http://172.16.2.220:12434/engines/v1").strip()
+LOCAL_LLM_API_KEY: str = get_env("LOCAL_LLM_API_KEY", "not-needed").strip()
+LOCAL_LLM_MODEL: str = os.getenv("LOCAL_LLM_MODEL", "ai/llama3.2:latest").strip()
 LOCAL_LLM_TIMEOUT_SECONDS: float = float(os.getenv("LOCAL_LLM_TIMEOUT_SECONDS", "90"))
+LOCAL_LLM_MAX_CONCURRENCY: int = max(1, int(os.getenv("LOCAL_LLM_MAX_CONCURRENCY", "4")))
 
 # Existing LLM_* vars remain the OpenAI fallback configuration for compatibility.
-OPENAI_BASE_URL: str = os.getenv("LLM_BASE_URL", "https://api.openai.com/v1")
-OPENAI_API_KEY: str = get_env("LLM_API_KEY", "")
-OPENAI_MODEL: str = os.getenv("LLM_MODEL", "gpt-4o-mini")
+OPENAI_BASE_URL: str = os.getenv("LLM_BASE_URL", "https://api.openai.com/v1").strip()
+OPENAI_API_KEY: str = get_env("LLM_API_KEY", "").strip()
+OPENAI_MODEL: str = os.getenv("LLM_MODEL", "gpt-4o-mini").strip()
 OPENAI_TIMEOUT_SECONDS: float = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "600"))
+OPENAI_MAX_CONCURRENCY: int = max(1, int(os.getenv("OPENAI_MAX_CONCURRENCY", "8")))
+
+# Cap in-flight completions per provider: the local model runner has few slots
+# and OpenAI answers bursts with 429s. Extra callers queue here instead.
+_local_llm_semaphore = LoopSemaphore(LOCAL_LLM_MAX_CONCURRENCY)
+_openai_semaphore = LoopSemaphore(OPENAI_MAX_CONCURRENCY)
 
 _SYSTEM_PROMPT = (
     "You are Marc's private assistant for marcle.ai support. "
@@ -31,6 +40,10 @@ _SYSTEM_PROMPT = (
     "If context is missing, state assumptions and ask up to 2 focused clarifying questions."
 )
 
+# Shared by every request; treat as read-only. The client copies messages while
+# normalizing them, so this dict never ends up mutated by a payload.
+_SYSTEM_MESSAGE: dict[str, str] = {"role": "system", "content": _SYSTEM_PROMPT}
+
 _SAFE_REFUSAL_RESPONSE = (
     "I can help with troubleshooting your issue, but I cannot provide internal platform details. "
     "Share the exact symptoms and what you already tried."
@@ -80,7 +93,7 @@ _SENSITIVE_OUTPUT_PATTERNS: tuple[str, ...] = (
     r"\bhosting\b",
     r"\binfrastructure\b",
     r"\bserver\s+status\b",
-    r"\bapi[-\s_]?key\b",
+    r"\bapi(?:[-_]|\s+)?key\b",
     r"\bpassword\b",
     r"\bsecret\b",
     r"\bcookie\b",
@@ -119,43 +132,66 @@ _SENSITIVE_DISCLOSURE_KEYWORDS: tuple[str, ...] = (
 )
 
 
-def _matches_any(patterns: tuple[str, ...], text: str) -> bool:
-    return any(re.search(pattern, text, flags=re.IGNORECASE) for pattern in patterns)
+def _compile_alternation(*pattern_sets: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile(
+        "|".join(f"(?:{pattern})" for patterns in pattern_sets for pattern in patterns),
+        re.IGNORECASE,
+    )
+
+
+# One alternation per decision so each text is scanned once, not once per pattern.
+_BLOCKED_REQUEST_RE = _compile_alternation(_INJECTION_PATTERNS, _SENSITIVE_REQUEST_PATTERNS)
+_SENSITIVE_OUTPUT_RE = _compile_alternation(_SENSITIVE_OUTPUT_PATTERNS)
+
+# Longest question any Ask ingestion path accepts (Discord-sourced questions;
+# the web form caps lower). Anything longer is refused without scanning.
+MAX_QUESTION_CHARS = 10000
+
+# Both keyword buckets are tallied in one loop; the sets route each hit.
+_HEURISTIC_KEYWORDS = _INJECTION_HEURISTIC_KEYWORDS + _SENSITIVE_DISCLOSURE_KEYWORDS
+_INJECTION_KEYWORD_SET = frozenset(_INJECTION_HEURISTIC_KEYWORDS)
+_INJECTION_ANCHOR_KEYWORDS = frozenset({"system", "developer"})
 
 
 def looks_like_injection(question_text: str) -> bool:
     """Classify prompt-injection or infra-disclosure attempts before model calls."""
-    normalized = " ".join((question_text or "").split())
-    if not normalized:
-        return True
-    if _matches_any(_INJECTION_PATTERNS, normalized):
-        return True
-    if _matches_any(_SENSITIVE_REQUEST_PATTERNS, normalized):
+    question_text = question_text or ""
+    if len(question_text) > MAX_QUESTION_CHARS:
         return True
-    lower = normalized.lower()
-    injection_hits = sum(1 for keyword in _INJECTION_HEURISTIC_KEYWORDS if keyword in lower)
-    if injection_hits >= 3 and ("system" in lower or "developer" in lower):
+    # Lowercase once up front; the blocked-request regex is case-insensitive
+    # and the keyword scan wants lowercase text anyway.
+    lower = " ".join(question_text.lower().split())
+    if not lower:
         return True
-    sensitive_hits = sum(1 for keyword in _SENSITIVE_DISCLOSURE_KEYWORDS if keyword in lower)
-    if sensitive_hits >= 2:
+    if _BLOCKED_REQUEST_RE.search(lower):
         return True
-    return False
+    injection_hits = 0
+    sensitive_hits = 0
+    anchored = False
+    for keyword in _HEURISTIC_KEYWORDS:
+        if keyword not in lower:
+            continue
+        if keyword in _INJECTION_KEYWORD_SET:
+            injection_hits += 1
+            anchored = anchored or keyword in _INJECTION_ANCHOR_KEYWORDS
+        else:
+            sensitive_hits += 1
+            if sensitive_hits >= 2:
+                return True
+    return injection_hits >= 3 and anchored
 
 
 def _filter_output(answer_text: str) -> str:
-    normalized = " ".join((answer_text or "").split())
-    if not normalized:
+    # The output patterns accept any whitespace run between words, so the answer
+    # is searched as-is instead of being re-joined into a normalized copy.
+    stripped = (answer_text or "").strip()
+    if not stripped or _SENSITIVE_OUTPUT_RE.search(stripped):
         return _SAFE_REFUSAL_RESPONSE
-    if _matches_any(_SENSITIVE_OUTPUT_PATTERNS, normalized):
-        return _SAFE_REFUSAL_RESPONSE
-    return answer_text.strip()
+    return stripped
 
 
 def _build_messages(question_text: str) -> list[dict[str, str]]:
-    return [
-        {"role": "system", "content": _SYSTEM_PROMPT},
-        {"role": "user", "content": question_text},
-    ]
+    return [_SYSTEM_MESSAGE, {"role": "user", "content": question_text}]
 
 
 async def generate_local_answer_text(question_text: str) -> str:
@@ -163,32 +199,34 @@ async def generate_local_answer_text(question_text: str) -> str:
     if looks_like_injection(question_text):
         return _SAFE_REFUSAL_RESPONSE
 
-    answer_text = await call_openai_compatible(
-        base_url=LOCAL_LLM_BASE_URL,
-        api_key=LOCAL_LLM_API_KEY,
-        model=LOCAL_LLM_MODEL,
-        messages=_build_messages(question_text),
-        timeout_seconds=LOCAL_LLM_TIMEOUT_SECONDS,
-        temperature=0.3,
-        max_tokens=600,
-    )
+    async with _local_llm_semaphore:
+        answer_text = await call_openai_compatible(
+            base_url=LOCAL_LLM_BASE_URL,
+            api_key=LOCAL_LLM_API_KEY,
+            model=LOCAL_LLM_MODEL,
+            messages=_build_messages(question_text),
+            timeout_seconds=LOCAL_LLM_TIMEOUT_SECONDS,
+            temperature=0.3,
+            max_tokens=600,
+        )
     return _filter_output(answer_text)
 
 
 async def generate_openai_answer_text(question_text: str) -> str:
     """Generate answer text from OpenAI as stage-3 fallback."""
-    if not OPENAI_API_KEY.strip():
+    if not OPENAI_API_KEY:
         raise RuntimeError("LLM_API_KEY is required for OpenAI fallback")
     if looks_like_injection(question_text):
         return _SAFE_REFUSAL_RESPONSE
 
-    answer_text = await call_openai_compatible(
-        base_url=OPENAI_BASE_URL,
-        api_key=OPENAI_API_KEY,
-        model=OPENAI_MODEL,
-        messages=_build_messages(question_text),
-        timeout_seconds=OPENAI_TIMEOUT_SECONDS,
-        temperature=0.3,
-        max_tokens=600,
-    )
+    async with _openai_semaphore:
+        answer_text = await call_openai_compatible(
+            base_url=OPENAI_BASE_URL,
+            api_key=OPENAI_API_KEY,
+            model=OPENAI_MODEL,
+            messages=_build_messages(question_text),
+            timeout_seconds=OPENAI_TIMEOUT_SECONDS,
+            temperature=0.3,
+            max_tokens=600,
+        )
     return _filter_output(answer_text)
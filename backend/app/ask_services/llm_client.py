@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
 from urllib.parse import urlparse, urlunparse
 
 import httpx
 
-from app.log_redact import httpx_event_hooks
+from app.http_client import get_client
 
 logger = logging.getLogger("marcle.ask.llm.client")
 
+# Error bodies are only logged as a short preview. Anything past this is not
+# read, so a proxy error page cannot balloon memory; smaller bodies are drained
+# so the connection can go back to the pool for the next candidate URL.
+_ERROR_BODY_READ_LIMIT = 64 * 1024
+_ERROR_PREVIEW_CHARS = 300
+
+# Candidate URL that last answered successfully, per base URL. Later calls try
+# it first so a 404 probe on the other candidate is paid once per process.
+_working_urls: dict[str, str] = {}
+
 
 class LLMClientError(RuntimeError):
     """Raised when an OpenAI-compatible request fails or has no usable output."""
@@ -32,8 +44,7 @@ def _dedupe(values: list[str]) -> list[str]:
     return ordered
 
 
-def build_chat_completion_urls(base_url: str) -> list[str]:
-    """Build one or more candidate chat-completion URLs from a base URL."""
+def _build_chat_completion_urls(base_url: str) -> list[str]:
     normalized = (base_url or "").strip().rstrip("/")
     if not normalized:
         raise LLMClientError("LLM base URL is not configured")
@@ -68,27 +79,36 @@ def build_chat_completion_urls(base_url: str) -> list[str]:
     return _dedupe(candidates)
 
 
+@functools.lru_cache(maxsize=16)
+def _cached_chat_completion_urls(base_url: str) -> tuple[str, ...]:
+    # Base URLs come from config, so parsing once per distinct value is enough.
+    # Invalid values raise and are therefore never cached.
+    return tuple(_build_chat_completion_urls(base_url))
+
+
+def build_chat_completion_urls(base_url: str) -> list[str]:
+    """Build one or more candidate chat-completion URLs from a base URL."""
+    return list(_cached_chat_completion_urls(base_url))
+
+
 def _extract_text_content(data: dict) -> str:
-    choices = data.get("choices")
-    if not isinstance(choices, list) or not choices:
-        return ""
-    first_choice = choices[0]
-    if not isinstance(first_choice, dict):
+    # Decoded JSON only holds exact dict/list/str types, so EAFP indexing and
+    # ``type() is`` checks cover every shape the old isinstance chain rejected.
+    try:
+        content = data["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError):
         return ""
-    message = first_choice.get("message")
-    if not isinstance(message, dict):
-        return ""
-    content = message.get("content")
-    if isinstance(content, str):
+    content_type = type(content)
+    if content_type is str:
         return content.strip()
-    if isinstance(content, list):
+    if content_type is list:
         parts: list[str] = []
         for item in content:
-            if isinstance(item, dict):
+            if type(item) is dict:
                 text = item.get("text")
-                if isinstance(text, str) and text.strip():
-                    parts.append(text.strip())
-        return "\n".join(parts).strip()
+                if type(text) is str and (text := text.strip()):
+                    parts.append(text)
+        return "\n".join(parts)
     return ""
 
 
@@ -118,6 +138,26 @@ def _normalize_messages(messages: list[dict[str, str]]) -> list[dict[str, str]]:
     return normalized
 
 
+async def _post_completion(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    payload: dict,
+    headers: dict[str, str],
+    timeout: httpx.Timeout,
+) -> tuple[int, bytes]:
+    """POST one completion request and return (status, body bytes)."""
+    async with client.stream("POST", url, json=payload, headers=headers, timeout=timeout) as response:
+        if response.status_code < 400:
+            return response.status_code, await response.aread()
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) >= _ERROR_BODY_READ_LIMIT:
+                break
+        return response.status_code, bytes(body)
+
+
 async def call_openai_compatible(
     *,
     base_url: str,
@@ -129,18 +169,23 @@ async def call_openai_compatible(
     max_tokens: int = 600,
 ) -> str:
     """Call an OpenAI-compatible chat-completions endpoint and return output text."""
-    if not model.strip():
+    model = model.strip()
+    if not model:
         raise LLMClientError("LLM model is not configured")
 
-    urls = build_chat_completion_urls(base_url)
+    urls = _cached_chat_completion_urls(base_url)
+    preferred_url = _working_urls.get(base_url)
+    if preferred_url is not None and preferred_url != urls[0]:
+        urls = (preferred_url, *(url for url in urls if url != preferred_url))
     headers = {"Content-Type": "application/json"}
-    if api_key and api_key.strip():
-        headers["Authorization"] = f"Bearer {api_key.strip()}"
+    api_key = (api_key or "").strip()
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
     normalized_messages = _normalize_messages(messages)
     safe_temperature = max(0.0, min(float(temperature), 2.0))
     safe_max_tokens = max(1, min(int(max_tokens), 4000))
     payload = {
-        "model": model.strip(),
+        "model": model,
         "messages": normalized_messages,
         "temperature": safe_temperature,
         "max_tokens": safe_max_tokens,
@@ -148,40 +193,43 @@ async def call_openai_compatible(
 
     timeout = httpx.Timeout(max(float(timeout_seconds), 1.0))
     last_error: Exception | None = None
-    async with httpx.AsyncClient(timeout=timeout, event_hooks=httpx_event_hooks()) as client:
-        for index, url in enumerate(urls):
-            try:
-                response = await client.post(url, json=payload, headers=headers)
-            except Exception as exc:
-                last_error = exc
-                if index < len(urls) - 1:
-                    logger.warning("LLM request transport error on %s, trying next candidate URL", url)
-                    continue
-                raise LLMClientError(f"LLM request failed: {exc.__class__.__name__}") from exc
-
-            if response.status_code >= 400:
-                body_preview = response.text[:300]
-                if response.status_code in {404, 405} and index < len(urls) - 1:
-                    logger.warning(
-                        "LLM endpoint candidate rejected status=%d url=%s body=%s; trying fallback URL",
-                        response.status_code,
-                        url,
-                        body_preview,
-                    )
-                    continue
-                raise LLMClientError(
-                    f"LLM request failed status={response.status_code} url={url} body={body_preview}"
+    client = get_client()
+    for index, url in enumerate(urls):
+        try:
+            status_code, body = await _post_completion(
+                client, url, payload=payload, headers=headers, timeout=timeout
+            )
+        except Exception as exc:
+            last_error = exc
+            if index < len(urls) - 1:
+                logger.warning("LLM request transport error on %s, trying next candidate URL", url)
+                continue
+            raise LLMClientError(f"LLM request failed: {exc.__class__.__name__}") from exc
+
+        if status_code >= 400:
+            body_preview = body.decode("utf-8", errors="replace")[:_ERROR_PREVIEW_CHARS]
+            if status_code in {404, 405} and index < len(urls) - 1:
+                logger.warning(
+                    "LLM endpoint candidate rejected status=%d url=%s body=%s; trying fallback URL",
+                    status_code,
+                    url,
+                    body_preview,
                 )
-
-            try:
-                data = response.json()
-            except ValueError as exc:
-                raise LLMClientError("LLM response is not valid JSON") from exc
-
-            content = _extract_text_content(data if isinstance(data, dict) else {})
-            if not content:
-                raise LLMClientError("LLM response did not include content")
-            return content
+                continue
+            raise LLMClientError(
+                f"LLM request failed status={status_code} url={url} body={body_preview}"
+            )
+
+        try:
+            data = json.loads(body)
+        except ValueError as exc:
+            raise LLMClientError("LLM response is not valid JSON") from exc
+
+        content = _extract_text_content(data if isinstance(data, dict) else {})
+        if not content:
+            raise LLMClientError("LLM response did not include content")
+        _working_urls[base_url] = url
+        return content
 
     if last_error is not None:
         raise LLMClientError(f"LLM request failed: {last_error.__class__.__name__}") from last_error
@@ -0,0 +1,32 @@
+"""Small asyncio helpers shared by the outbound-call modules."""
+
+from __future__ import annotations
+
+import asyncio
+
+
+class LoopSemaphore:
+    """``asyncio.Semaphore`` that is created lazily for the running event loop.
+
+    A module-level semaphore binds to the first loop that waits on it and then
+    raises ``RuntimeError`` on any other loop (a second ``asyncio.run``, a test
+    run). Like ``app.http_client.get_client``, a new loop gets a fresh one.
+    """
+
+    def __init__(self, value: int) -> None:
+        self._value = value
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._value)
+            self._loop = loop
+        return self._semaphore
+
+    async def __aenter__(self) -> None:
+        await self._get().acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._get().release()
@@ -2,76 +2,193 @@
 
 from __future__ import annotations
 
+import errno
 import json
 import logging
 import os
-import tempfile
-from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from threading import Lock
+from threading import Condition, Lock
 from typing import Any
 
 from app import config
+from app.fs_utils import atomic_write_bytes
 
 logger = logging.getLogger("marcle.audit_log")
 
+# pwritev2 with RWF_DSYNC (Linux 4.7+) writes and syncs in one syscall instead
+# of write() followed by fsync(). Offset -1 keeps O_APPEND semantics.
+_RWF_DSYNC: int | None = getattr(os, "RWF_DSYNC", None) if hasattr(os, "pwritev") else None
+_DSYNC_UNSUPPORTED_ERRNOS = frozenset({errno.EINVAL, errno.EOPNOTSUPP, errno.ENOSYS})
+
+_TAIL_READ_BYTES = 64 * 1024
+# Once over max_bytes, trim down to this fraction of it so the rewrite happens
+# once per quarter of max_bytes appended rather than on every append.
+_TRIM_TARGET_RATIO = 0.75
+
+
+@dataclass(slots=True)
+class _PendingBatch:
+    lines: list[bytes] = field(default_factory=list)
+    done: bool = False
+    error: BaseException | None = None
+
 
 class AuditLogStore:
+    """Audit log with group commit: concurrent appends share one write+fsync.
+
+    The first appender to find no flush in progress writes every line queued so
+    far; appenders arriving meanwhile queue behind it and are flushed together
+    in the next batch. ``append`` still returns only once its line is on disk.
+    """
+
     def __init__(self, path: str, max_bytes: int):
         self.path = Path(path)
         self.max_bytes = max(1024, int(max_bytes))
+        self._trim_to_bytes = int(self.max_bytes * _TRIM_TARGET_RATIO)
         self._lock = Lock()
+        self._fd: int | None = None
+        # Bytes in the log as of the open descriptor; refreshed with fstat on
+        # every (re)open so appends need no stat() of their own.
+        self._size = 0
+        self._dsync_writes = _RWF_DSYNC is not None
+        self._pending = Condition(Lock())
+        self._open_batch = _PendingBatch()
+        self._flushing = False
 
     def append(self, payload: dict[str, Any]) -> None:
         line = json.dumps(payload, separators=(",", ":"), ensure_ascii=False) + "\n"
         encoded = line.encode("utf-8")
 
-        with self._lock:
+        with self._pending:
+            batch = self._open_batch
+            batch.lines.append(encoded)
+            while not batch.done:
+                if self._flushing:
+                    self._pending.wait()
+                    continue
+                # No flush in progress, so this batch is still the open one.
+                self._flushing = True
+                self._open_batch = _PendingBatch()
+                self._pending.release()
+                try:
+                    self._flush_batch(batch)
+                finally:
+                    self._pending.acquire()
+                    self._flushing = False
+                    self._pending.notify_all()
+        if batch.error is not None:
+            raise batch.error
+
+    def _flush_batch(self, batch: _PendingBatch) -> None:
+        try:
+            with self._lock:
+                try:
+                    fd = self._append_fd_unlocked()
+                    data = b"".join(batch.lines)
+                    self._write_synced_unlocked(fd, data)
+                    self._size += len(data)
+                    self._enforce_max_size_unlocked()
+                except BaseException as exc:
+                    batch.error = exc
+                    self._close_fd_unlocked()
+        finally:
+            batch.done = True
+
+    def _write_synced_unlocked(self, fd: int, data: bytes) -> None:
+        if self._dsync_writes:
+            try:
+                while data:
+                    written = os.pwritev(fd, [data], -1, _RWF_DSYNC)
+                    data = data[written:]
+                return
+            except OSError as exc:
+                # Rejected before any data is written on kernels or filesystems
+                # without per-write sync; use write()+fsync() from now on.
+                if exc.errno not in _DSYNC_UNSUPPORTED_ERRNOS:
+                    raise
+                self._dsync_writes = False
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+        os.fsync(fd)
+
+    def _append_fd_unlocked(self) -> int:
+        if self._fd is None:
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            fd = os.open(self.path, os.O_APPEND | os.O_CREAT | os.O_WRONLY)
+            self._fd = os.open(self.path, os.O_APPEND | os.O_CREAT | os.O_WRONLY)
+            self._size = os.fstat(self._fd).st_size
+        return self._fd
+
+    def _close_fd_unlocked(self) -> None:
+        fd = self._fd
+        self._fd = None
+        if fd is not None:
             try:
-                os.write(fd, encoded)
-                os.fsync(fd)
-            finally:
                 os.close(fd)
-
-            self._enforce_max_size_unlocked()
+            except OSError:
+                pass
 
     def recent(self, limit: int) -> list[dict[str, Any]]:
+        """Return up to ``limit`` newest entries, newest first.
+
+        The log is read backwards in blocks from the end, so the cost scales with
+        the entries returned rather than the size of the file.
+        """
         bounded_limit = max(1, min(int(limit), 500))
         with self._lock:
-            if not self.path.exists():
+            try:
+                fd = os.open(self.path, os.O_RDONLY)
+            except FileNotFoundError:
                 return []
+            try:
+                return self._read_newest_unlocked(fd, bounded_limit)
+            finally:
+                os.close(fd)
 
-            entries: deque[dict[str, Any]] = deque(maxlen=bounded_limit)
-            with self.path.open("r", encoding="utf-8") as handle:
-                for raw_line in handle:
-                    line = raw_line.strip()
-                    if not line:
-                        continue
-                    try:
-                        parsed = json.loads(line)
-                    except json.JSONDecodeError:
-                        logger.warning("Skipping malformed audit log line")
-                        continue
-                    if isinstance(parsed, dict):
-                        entries.append(parsed)
-
-        output = list(entries)
-        output.reverse()
-        return output
+    def _read_newest_unlocked(self, fd: int, limit: int) -> list[dict[str, Any]]:
+        entries: list[dict[str, Any]] = []
+        position = os.fstat(fd).st_size
+        partial = b""
+        while position > 0 and len(entries) < limit:
+            read_size = min(_TAIL_READ_BYTES, position)
+            position -= read_size
+            lines = (os.pread(fd, read_size, position) + partial).split(b"\n")
+            # Until the start of the file is reached, the first line may be
+            # cut off; carry it into the next (earlier) block.
+            partial = lines.pop(0) if position > 0 else b""
+            for raw_line in reversed(lines):
+                line = raw_line.strip()
+                if not line:
+                    continue
+                try:
+                    parsed = json.loads(line)
+                except ValueError:
+                    logger.warning("Skipping malformed audit log line")
+                    continue
+                if isinstance(parsed, dict):
+                    entries.append(parsed)
+                    if len(entries) >= limit:
+                        break
+        return entries
 
     def _enforce_max_size_unlocked(self) -> None:
+        if self._size <= self.max_bytes:
+            return
+
+        # Re-check on disk: something else may have truncated or rotated it.
         try:
             size_bytes = self.path.stat().st_size
         except FileNotFoundError:
+            self._close_fd_unlocked()
             return
 
         if size_bytes <= self.max_bytes:
+            self._size = size_bytes
             return
 
         with self.path.open("rb") as handle:
-            handle.seek(max(0, size_bytes - self.max_bytes))
+            handle.seek(max(0, size_bytes - self._trim_to_bytes))
             tail = handle.read()
 
         if tail:
@@ -80,18 +197,10 @@ class AuditLogStore:
         else:
             trimmed = b""
 
-        with tempfile.NamedTemporaryFile(
-            mode="wb",
-            dir=self.path.parent,
-            prefix=f"{self.path.name}.",
-            suffix=".tmp",
-            delete=False,
-        ) as tmp:
-            tmp.write(trimmed)
-            tmp.flush()
-            os.fsync(tmp.fileno())
-            tmp_path = Path(tmp.name)
-        tmp_path.replace(self.path)
+        atomic_write_bytes(self.path, trimmed)
+        # The open descriptor still points at the replaced file.
+        self._close_fd_unlocked()
+        self._size = len(trimmed)
 
 
 audit_log_store = AuditLogStore(config.AUDIT_LOG_PATH, config.AUDIT_LOG_MAX_BYTES)
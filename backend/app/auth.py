@@ -1,6 +1,6 @@
 """Authentication header construction for upstream checks."""
 
-import base64
+import binascii
 import os
 
 from app.models import AuthRef
@@ -19,7 +19,14 @@ class InvalidCredentialFormatError(Exception):
         self.scheme = scheme
 
 
+# (scheme, env name, header name) -> (env value, headers built from it). The env
+# var is still read on every call, so a rotated credential takes effect at once;
+# only the formatting and base64 work is reused.
+_header_cache: dict[tuple[str, str, str | None], tuple[str, dict[str, str]]] = {}
+
+
 def build_auth_headers(auth_ref: AuthRef | None) -> dict[str, str]:
+    """Return upstream auth headers; the dict may be shared, so do not mutate it."""
     if auth_ref is None or auth_ref.scheme == "none":
         return {}
 
@@ -28,12 +35,23 @@ def build_auth_headers(auth_ref: AuthRef | None) -> dict[str, str]:
     if not value:
         raise MissingCredentialError(env_name)
 
+    cache_key = (auth_ref.scheme, env_name, auth_ref.header_name)
+    cached = _header_cache.get(cache_key)
+    if cached is not None and cached[0] == value:
+        return cached[1]
+
+    headers = _render_auth_headers(auth_ref, env_name, value)
+    _header_cache[cache_key] = (value, headers)
+    return headers
+
+
+def _render_auth_headers(auth_ref: AuthRef, env_name: str, value: str) -> dict[str, str]:
     if auth_ref.scheme == "bearer":
         return {"Authorization": f"Bearer {value}"}
     if auth_ref.scheme == "basic":
         if ":" not in value:
             raise InvalidCredentialFormatError(env_name, "basic")
-        basic = base64.b64encode(value.encode("utf-8")).decode("ascii")
+        basic = binascii.b2a_base64(value.encode("utf-8"), newline=False).decode("ascii")
         return {"Authorization": f"Basic {basic}"}
     if auth_ref.scheme == "header":
         return {auth_ref.header_name: value}  # validated in model
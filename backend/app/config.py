@@ -2,14 +2,14 @@
 
 import os
 
-from app.env_utils import get_env
+from app.env_utils import TRUTHY_ENV_VALUES, get_env
 
 
 def _env_bool(name: str, default: bool = False) -> bool:
     raw = os.getenv(name)
     if raw is None:
         return default
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
+    return raw.strip().lower() in TRUTHY_ENV_VALUES
 
 
 def _env_csv(name: str) -> list[str]:
@@ -22,8 +22,10 @@ def _env_csv(name: str) -> list[str]:
 REQUEST_TIMEOUT_SECONDS: float = float(os.getenv("REQUEST_TIMEOUT_SECONDS", "4"))
 CHECK_TIMEOUT_SECONDS: float = float(os.getenv("CHECK_TIMEOUT_SECONDS", str(REQUEST_TIMEOUT_SECONDS)))
 REFRESH_INTERVAL_SECONDS: float = float(os.getenv("REFRESH_INTERVAL_SECONDS", "30"))
+CHECK_CACHE_TTL_SECONDS: float = float(os.getenv("CHECK_CACHE_TTL_SECONDS", "2"))
 MAX_CONCURRENCY: int = int(os.getenv("MAX_CONCURRENCY", "10"))
 SERVICES_CONFIG_PATH: str = os.getenv("SERVICES_CONFIG_PATH", "/data/services.json")
+SERVICES_CONFIG_FSYNC: bool = _env_bool("SERVICES_CONFIG_FSYNC", False)
 NOTIFICATIONS_CONFIG_PATH: str = os.getenv("NOTIFICATIONS_CONFIG_PATH", "/data/notifications.json")
 OBSERVATIONS_PATH: str = os.getenv("OBSERVATIONS_PATH", "/data/observations.json")
 OBSERVATIONS_HISTORY_LIMIT: int = int(os.getenv("OBSERVATIONS_HISTORY_LIMIT", "200"))
@@ -1,24 +1,37 @@
 """Runtime service configuration store backed by JSON on disk."""
 
-import json
+import functools
 import logging
 import os
-import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from threading import Lock
 
-from pydantic import TypeAdapter
+from pydantic import BaseModel, TypeAdapter
 
 from app import config
+from app.fs_utils import atomic_write_bytes
 from app.models import AuthRef, ServiceConfig, ServiceGroup
 
 logger = logging.getLogger("marcle.config_store")
 
 _SERVICES_ADAPTER = TypeAdapter(list[ServiceConfig])
+# Serializes the whole {"services": [...]} document in one pydantic-core pass.
+_SERVICES_DOCUMENT_ADAPTER = TypeAdapter(dict[str, list[ServiceConfig]])
 
 
-def _default_services() -> list[ServiceConfig]:
-    return [
+class _ServicesFile(BaseModel):
+    """On-disk {"services": [...]} document; unknown top-level keys are ignored."""
+
+    services: list[ServiceConfig] = []
+
+
+@functools.lru_cache(maxsize=1)
+def _default_services() -> tuple[ServiceConfig, ...]:
+    """Seed services for a missing config file, built once per process."""
+    return (
         ServiceConfig(
             id="proxmox",
             name="Proxmox",
@@ -126,126 +139,191 @@ def _default_services() -> list[ServiceConfig]:
             enabled=True,
             description="Workflow automation",
         ),
-    ]
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class _ServicesSnapshot:
+    """Parsed services and the file (inode, size, mtime) they were read from."""
+
+    services: tuple[ServiceConfig, ...]
+    identity: tuple[int, int, int]
+    # Position of each service id (first one wins if a hand-edited file repeats
+    # an id), so mutations skip a linear scan.
+    positions: dict[str, int]
+
+
+class ServicesTransaction:
+    """Mutable working copy of the services list used inside ``transaction()``.
+
+    Edits only touch memory; the store writes the result once when the
+    transaction exits, and only if something changed.
+    """
+
+    def __init__(self, snapshot: _ServicesSnapshot):
+        self.services = list(snapshot.services)
+        self._positions = dict(snapshot.positions)
+        self.changed = False
+
+    def get(self, service_id: str) -> ServiceConfig | None:
+        index = self._positions.get(service_id)
+        return None if index is None else self.services[index]
+
+    def create(self, service: ServiceConfig) -> None:
+        if service.id in self._positions:
+            raise ValueError(f"Service '{service.id}' already exists")
+        self._append(service)
+
+    def upsert(self, service: ServiceConfig) -> None:
+        index = self._positions.get(service.id)
+        if index is None:
+            self._append(service)
+        else:
+            self.services[index] = service
+            self.changed = True
+
+    def delete(self, service_id: str) -> ServiceConfig | None:
+        index = self._positions.get(service_id)
+        if index is None:
+            return None
+        removed = self.services[index]
+        self.services = [service for service in self.services if service.id != service_id]
+        self._positions = {}
+        for position, service in enumerate(self.services):
+            self._positions.setdefault(service.id, position)
+        self.changed = True
+        return removed
+
+    def toggle(self, service_id: str) -> ServiceConfig | None:
+        index = self._positions.get(service_id)
+        if index is None:
+            return None
+        return self._set_enabled_at(index, not self.services[index].enabled)
+
+    def bulk_set_enabled(self, service_ids: list[str], enabled: bool) -> list[ServiceConfig]:
+        target_ids = set(service_ids)
+        return [
+            self._set_enabled_at(index, enabled)
+            for index, service in enumerate(self.services)
+            if service.id in target_ids
+        ]
+
+    def _set_enabled_at(self, index: int, enabled: bool) -> ServiceConfig:
+        existing = self.services[index]
+        if existing.enabled == enabled:
+            return existing
+        updated = existing.model_copy(update={"enabled": enabled})
+        self.services[index] = updated
+        self.changed = True
+        return updated
+
+    def _append(self, service: ServiceConfig) -> None:
+        self._positions[service.id] = len(self.services)
+        self.services.append(service)
+        self.changed = True
 
 
 class ConfigStore:
-    def __init__(self, path: str):
+    """Services config on disk, served from an immutable in-memory snapshot.
+
+    The file is only re-parsed when it changes on disk, e.g. a manual edit.
+    Writers hold the lock and publish a new snapshot with a single attribute
+    assignment; readers take the current snapshot without locking and only
+    fall back to the lock when the file no longer matches it.
+    """
+
+    def __init__(self, path: str, *, fsync: bool = False):
         self.path = Path(path)
+        # Off by default: the atomic rename already rules out torn files, and
+        # only the latest edit is at risk on power loss.
+        self.fsync = fsync
         self._lock = Lock()
+        self._snapshot: _ServicesSnapshot | None = None
         self._ensure_file()
 
     def _ensure_file(self) -> None:
         if self.path.exists():
             return
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._write_services_unlocked(_default_services())
+        self._write_services_unlocked(list(_default_services()))
         logger.info("Created default service config at %s", self.path)
 
+    def _file_identity(self) -> tuple[int, int, int]:
+        stat = self.path.stat()
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _current_snapshot_unlocked(self) -> _ServicesSnapshot:
+        snapshot = self._snapshot
+        identity = self._file_identity()
+        if snapshot is None or identity != snapshot.identity:
+            snapshot = self._publish_unlocked(self._read_services_unlocked(), identity)
+        return snapshot
+
+    def _publish_unlocked(self, services: list[ServiceConfig], identity: tuple[int, int, int]) -> _ServicesSnapshot:
+        positions: dict[str, int] = {}
+        for index, service in enumerate(services):
+            positions.setdefault(service.id, index)
+        snapshot = _ServicesSnapshot(services=tuple(services), identity=identity, positions=positions)
+        self._snapshot = snapshot
+        return snapshot
+
     def _read_services_unlocked(self) -> list[ServiceConfig]:
-        raw = self.path.read_text(encoding="utf-8")
-        payload = json.loads(raw)
-        if isinstance(payload, dict):
-            data = payload.get("services", [])
-        elif isinstance(payload, list):
-            data = payload
-        else:
-            raise ValueError("Invalid services config format")
-        return _SERVICES_ADAPTER.validate_python(data)
+        # Validate straight from the file bytes so pydantic-core parses the
+        # JSON itself, without building an intermediate str and dict tree.
+        raw = self.path.read_bytes()
+        start = raw.lstrip()[:1]
+        if start == b"{":
+            return _ServicesFile.model_validate_json(raw).services
+        if start == b"[":
+            return _SERVICES_ADAPTER.validate_json(raw)
+        raise ValueError("Invalid services config format")
 
     def _write_services_unlocked(self, services: list[ServiceConfig]) -> None:
-        payload = {
-            "services": [svc.model_dump(mode="json", exclude_none=True) for svc in services],
-        }
+        content = _SERVICES_DOCUMENT_ADAPTER.dump_json({"services": services}, indent=2, exclude_none=True) + b"\n"
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        content = json.dumps(payload, indent=2) + "\n"
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=self.path.parent,
-            prefix=f"{self.path.name}.",
-            suffix=".tmp",
-            delete=False,
-        ) as tmp:
-            tmp.write(content)
-            tmp.flush()
-            os.fsync(tmp.fileno())
-            tmp_path = Path(tmp.name)
-        tmp_path.replace(self.path)
+        atomic_write_bytes(self.path, content, sync=self.fsync)
+        self._publish_unlocked(services, self._file_identity())
 
     def list_services(self) -> list[ServiceConfig]:
+        snapshot = self._snapshot
+        # Stat after taking the snapshot: a match means no write has replaced
+        # the file since, so the snapshot is current without taking the lock.
+        if snapshot is not None and snapshot.identity == self._file_identity():
+            return list(snapshot.services)
         with self._lock:
-            return self._read_services_unlocked()
+            return list(self._current_snapshot_unlocked().services)
 
-    def create_service(self, service: ServiceConfig) -> None:
+    @contextmanager
+    def transaction(self) -> Iterator[ServicesTransaction]:
+        """Apply several edits under one lock hold and a single file write.
+
+        Nothing is written if the block raises or makes no changes.
+        """
         with self._lock:
-            services = self._read_services_unlocked()
-            if any(s.id == service.id for s in services):
-                raise ValueError(f"Service '{service.id}' already exists")
-            services.append(service)
-            self._write_services_unlocked(services)
+            txn = ServicesTransaction(self._current_snapshot_unlocked())
+            yield txn
+            if txn.changed:
+                self._write_services_unlocked(txn.services)
+
+    def create_service(self, service: ServiceConfig) -> None:
+        with self.transaction() as txn:
+            txn.create(service)
 
     def upsert_service(self, service: ServiceConfig) -> None:
-        with self._lock:
-            services = self._read_services_unlocked()
-            replaced = False
-            for i, existing in enumerate(services):
-                if existing.id == service.id:
-                    services[i] = service
-                    replaced = True
-                    break
-            if not replaced:
-                services.append(service)
-            self._write_services_unlocked(services)
+        with self.transaction() as txn:
+            txn.upsert(service)
 
     def delete_service(self, service_id: str) -> ServiceConfig | None:
-        with self._lock:
-            services = self._read_services_unlocked()
-            remaining: list[ServiceConfig] = []
-            removed: ServiceConfig | None = None
-            for service in services:
-                if service.id == service_id:
-                    removed = service
-                    continue
-                remaining.append(service)
-            if removed is None:
-                return None
-            self._write_services_unlocked(remaining)
-            return removed
+        with self.transaction() as txn:
+            return txn.delete(service_id)
 
     def toggle_service(self, service_id: str) -> ServiceConfig | None:
-        with self._lock:
-            services = self._read_services_unlocked()
-            updated: ServiceConfig | None = None
-            for i, existing in enumerate(services):
-                if existing.id != service_id:
-                    continue
-                updated = existing.model_copy(update={"enabled": not existing.enabled})
-                services[i] = updated
-                break
-            if updated is None:
-                return None
-            self._write_services_unlocked(services)
-            return updated
+        with self.transaction() as txn:
+            return txn.toggle(service_id)
 
     def bulk_set_enabled(self, service_ids: list[str], enabled: bool) -> list[ServiceConfig]:
-        with self._lock:
-            target_ids = set(service_ids)
-            services = self._read_services_unlocked()
-            updated: list[ServiceConfig] = []
-            for i, existing in enumerate(services):
-                if existing.id not in target_ids:
-                    continue
-                if existing.enabled == enabled:
-                    updated_service = existing
-                else:
-                    updated_service = existing.model_copy(update={"enabled": enabled})
-                    services[i] = updated_service
-                updated.append(updated_service)
-            if not updated:
-                return []
-            self._write_services_unlocked(services)
-            return updated
-
-
-config_store = ConfigStore(config.SERVICES_CONFIG_PATH)
+        with self.transaction() as txn:
+            return txn.bulk_set_enabled(service_ids, enabled)
+
+
+config_store = ConfigStore(config.SERVICES_CONFIG_PATH, fsync=config.SERVICES_CONFIG_FSYNC)
@@ -1,6 +1,7 @@
 """Discord bot client for Ask human-answer ingestion and answer posting."""
 
 import asyncio
+import functools
 import logging
 import os
 from typing import Awaitable, Callable
@@ -8,7 +9,7 @@ from typing import Awaitable, Callable
 import httpx
 
 from app.env_utils import get_env
-from app.log_redact import httpx_event_hooks
+from app.http_client import get_client
 
 try:
     import discord
@@ -20,6 +21,12 @@ logger = logging.getLogger("marcle.ask.discord.bot")
 DISCORD_BOT_TOKEN: str = get_env("DISCORD_BOT_TOKEN", "")
 DISCORD_SUPPORT_ROLE_ID: str = os.getenv("DISCORD_SUPPORT_ROLE_ID", "")
 DISCORD_API_BASE: str = os.getenv("DISCORD_API_BASE", "https://discord.com/api/v10")
+_DISCORD_API_ROOT: str = DISCORD_API_BASE.rstrip("/")
+_POST_TIMEOUT = httpx.Timeout(timeout=15.0)
+_BOT_HEADERS: dict[str, str] = {
+    "Authorization": f"Bot {DISCORD_BOT_TOKEN}",
+    "Content-Type": "application/json",
+}
 
 HumanAnswerCallback = Callable[[dict[str, str]], Awaitable[None]]
 
@@ -27,6 +34,7 @@ _client: "AskDiscordClient | None" = None
 _client_task: asyncio.Task | None = None
 
 
+@functools.lru_cache(maxsize=1)
 def _support_role_id_int() -> int | None:
     value = DISCORD_SUPPORT_ROLE_ID.strip()
     if not value:
@@ -60,15 +68,8 @@ class AskDiscordClient(discord.Client):  # type: ignore[misc]
         if message.guild is None:
             return
 
-        member = message.author if isinstance(message.author, discord.Member) else None
-        if member is None:
-            try:
-                member = await message.guild.fetch_member(message.author.id)
-            except Exception:
-                logger.warning("Could not fetch member for discord author=%s", getattr(message.author, "id", "unknown"))
-                return
-
-        if all(role.id != self._support_role_id for role in getattr(member, "roles", [])):
+        # Cheap local filters first: fetching the member is a REST round trip.
+        if not (message.content or "").strip():
             return
 
         is_thread = isinstance(message.channel, discord.Thread)
@@ -81,6 +82,18 @@ class AskDiscordClient(discord.Client):  # type: ignore[misc]
         if not is_thread and not reply_to_message_id:
             return
 
+        member = message.author if isinstance(message.author, discord.Member) else None
+        if member is None:
+            try:
+                member = await message.guild.fetch_member(message.author.id)
+            except Exception:
+                logger.warning("Could not fetch member for discord author=%s", getattr(message.author, "id", "unknown"))
+                return
+
+        role_ids = {role.id for role in getattr(member, "roles", ())}
+        if self._support_role_id not in role_ids:
+            return
+
         if is_thread:
             channel_id = str(getattr(message.channel, "parent_id", "") or message.channel.id)
             thread_id = str(message.channel.id)
@@ -88,9 +101,6 @@ class AskDiscordClient(discord.Client):  # type: ignore[misc]
             channel_id = str(message.channel.id)
             thread_id = ""
 
-        if not (message.content or "").strip():
-            return
-
         payload = {
             "guild_id": str(message.guild.id),
             "channel_id": channel_id,
@@ -172,7 +182,7 @@ async def post_answer_to_discord(
     if not target_channel:
         return False
 
-    url = f"{DISCORD_API_BASE.rstrip('/')}/channels/{target_channel}/messages"
+    url = f"{_DISCORD_API_ROOT}/channels/{target_channel}/messages"
     payload: dict[str, object] = {
         "content": answer_text[:1900],
         "allowed_mentions": {"replied_user": False},
@@ -180,16 +190,11 @@ async def post_answer_to_discord(
     if not thread_id and reply_to_message_id:
         payload["message_reference"] = {"message_id": reply_to_message_id}
 
-    headers = {
-        "Authorization": f"Bot {DISCORD_BOT_TOKEN}",
-        "Content-Type": "application/json",
-    }
     try:
-        async with httpx.AsyncClient(timeout=15.0, event_hooks=httpx_event_hooks()) as client:
-            resp = await client.post(url, json=payload, headers=headers)
-            if resp.status_code >= 400:
-                logger.warning("Discord answer post failed status=%d body=%s", resp.status_code, resp.text[:300])
-                return False
+        resp = await get_client().post(url, json=payload, headers=_BOT_HEADERS, timeout=_POST_TIMEOUT)
+        if resp.status_code >= 400:
+            logger.warning("Discord answer post failed status=%d body=%s", resp.status_code, resp.text[:300])
+            return False
         return True
     except Exception:
         logger.exception("Failed posting answer to Discord")
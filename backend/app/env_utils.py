@@ -5,6 +5,13 @@ from __future__ import annotations
 from pathlib import Path
 import os
 
+# Lowercased env values that count as "enabled" for boolean settings.
+TRUTHY_ENV_VALUES = frozenset({"1", "true", "yes", "on"})
+
+# Secret file path -> ((mtime_ns, size), stripped contents). A stat is much
+# cheaper than re-reading the file, and still picks up a rotated secret.
+_secret_file_cache: dict[str, tuple[tuple[int, int], str]] = {}
+
 
 def get_env(name: str, default: str = "") -> str:
     """Resolve environment value with optional *_FILE fallback."""
@@ -15,10 +22,21 @@ def get_env(name: str, default: str = "") -> str:
     file_path = (os.getenv(f"{name}_FILE") or "").strip()
     if file_path:
         try:
-            secret = Path(file_path).read_text(encoding="utf-8").strip()
+            secret = _read_secret_file(file_path)
             if secret:
                 return secret
         except OSError:
             return default
 
     return default
+
+
+def _read_secret_file(file_path: str) -> str:
+    stat = os.stat(file_path)
+    identity = (stat.st_mtime_ns, stat.st_size)
+    cached = _secret_file_cache.get(file_path)
+    if cached is not None and cached[0] == identity:
+        return cached[1]
+    secret = Path(file_path).read_text(encoding="utf-8").strip()
+    _secret_file_cache[file_path] = (identity, secret)
+    return secret
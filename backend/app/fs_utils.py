@@ -0,0 +1,89 @@
+"""Small filesystem helpers shared by the JSON/log stores."""
+
+from __future__ import annotations
+
+import errno
+import os
+import secrets
+from pathlib import Path
+
+# fdatasync skips flushing metadata that is not needed to read the data back
+# (e.g. mtime); platforms without it (macOS) fall back to fsync.
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+# O_TMPFILE (Linux 3.11+) creates an unnamed inode in the target directory; it
+# only gets a name once fully written and synced, so a crash never leaves a
+# half-written temp file behind.
+_O_TMPFILE: int | None = getattr(os, "O_TMPFILE", None)
+_TMPFILE_UNSUPPORTED_ERRNOS = frozenset({errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL, errno.ENOENT, errno.EXDEV})
+
+
+def atomic_write_bytes(path: Path, data: bytes, *, sync: bool = True) -> None:
+    """Replace ``path`` with ``data`` via a sibling temp file and rename.
+
+    The rename alone already prevents torn files; ``sync`` additionally flushes
+    the data before the rename so the new contents survive a power loss.
+    """
+    tmp_path = path.with_name(f"{path.name}.{secrets.token_hex(6)}.tmp")
+    if _O_TMPFILE is not None and _write_via_tmpfile(path, tmp_path, data, sync=sync):
+        return
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            if sync:
+                _datasync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _write_via_tmpfile(path: Path, tmp_path: Path, data: bytes, *, sync: bool) -> bool:
+    """Write through an O_TMPFILE inode; return False if unsupported here."""
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return False
+    try:
+        try:
+            fd = os.open(".", _O_TMPFILE | os.O_WRONLY, 0o600, dir_fd=dir_fd)
+        except OSError as exc:
+            if exc.errno in _TMPFILE_UNSUPPORTED_ERRNOS:
+                return False
+            raise
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            if sync:
+                _datasync(fd)
+            # A dir_fd makes os.link use linkat(AT_SYMLINK_FOLLOW), which is
+            # what resolves the /proc magic link to the unnamed inode.
+            try:
+                os.link(f"/proc/self/fd/{fd}", tmp_path.name, dst_dir_fd=dir_fd, follow_symlinks=True)
+            except OSError as exc:
+                # No usable /proc; the unnamed inode is freed on close.
+                if exc.errno in _TMPFILE_UNSUPPORTED_ERRNOS:
+                    return False
+                raise
+        finally:
+            os.close(fd)
+        try:
+            os.replace(tmp_path.name, path.name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+        except BaseException:
+            try:
+                os.unlink(tmp_path.name, dir_fd=dir_fd)
+            except FileNotFoundError:
+                pass
+            raise
+        return True
+    finally:
+        os.close(dir_fd)
@@ -0,0 +1,94 @@
+"""Shared pooled httpx clients for outbound calls."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+import logging
+
+import httpx
+
+from app import config
+from app.log_redact import httpx_event_hooks
+
+logger = logging.getLogger("marcle.http_client")
+
+DEFAULT_TIMEOUT = httpx.Timeout(timeout=config.REQUEST_TIMEOUT_SECONDS)
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+
+_clients: dict[bool, httpx.AsyncClient] = {}
+_clients_loop: asyncio.AbstractEventLoop | None = None
+# Closes of clients left behind by a previous loop; held so they are not GC'd.
+_pending_closes: set[asyncio.Future | Future] = set()
+
+
+def get_client(*, verify: bool = True) -> httpx.AsyncClient:
+    """Return the process-wide client for ``verify``, creating it on first use.
+
+    Creation has no await points, so it is race-free on the event loop. Pooled
+    connections are bound to the loop that opened them; a new loop starts a
+    fresh set of clients, and the old ones are closed.
+    """
+    global _clients_loop
+    loop = asyncio.get_running_loop()
+    if _clients_loop is not loop:
+        _discard_clients(_clients_loop, loop)
+        _clients_loop = loop
+
+    client = _clients.get(verify)
+    if client is None:
+        client = _new_client(verify=verify)
+        _clients[verify] = client
+    return client
+
+
+class _RejectAllCookies(DefaultCookiePolicy):
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+
+def _new_client(*, verify: bool, **kwargs) -> httpx.AsyncClient:
+    # One client serves every caller (health checks, Discord, LLM, OAuth), so a
+    # Set-Cookie from one response must never ride along on the next request.
+    return httpx.AsyncClient(
+        verify=verify,
+        timeout=DEFAULT_TIMEOUT,
+        limits=POOL_LIMITS,
+        cookies=CookieJar(policy=_RejectAllCookies()),
+        event_hooks=httpx_event_hooks(),
+        **kwargs,
+    )
+
+
+def _discard_clients(
+    old_loop: asyncio.AbstractEventLoop | None, loop: asyncio.AbstractEventLoop
+) -> None:
+    stale = list(_clients.values())
+    _clients.clear()
+    for client in stale:
+        if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+            # Still serving another thread: close on the loop that owns the pool.
+            future = asyncio.run_coroutine_threadsafe(_close_client(client), old_loop)
+        else:
+            # The owning loop is gone, so nothing else can use these connections;
+            # closing from the current loop just releases the sockets.
+            future = loop.create_task(_close_client(client))
+        _pending_closes.add(future)
+        future.add_done_callback(_pending_closes.discard)
+
+
+async def _close_client(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except Exception:
+        logger.exception("Failed closing shared HTTP client")
+
+
+async def close_clients() -> None:
+    global _clients_loop
+    clients = list(_clients.values())
+    _clients.clear()
+    _clients_loop = None
+    for client in clients:
+        await _close_client(client)
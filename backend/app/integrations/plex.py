@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import os
 import re
@@ -12,13 +14,16 @@ from xml.etree import ElementTree
 
 import httpx
 
-from app import config
 from app.auth import InvalidCredentialFormatError, MissingCredentialError, build_auth_params
-from app.log_redact import httpx_event_hooks
+from app.env_utils import TRUTHY_ENV_VALUES
+from app.http_client import get_client
 from app.models import AuthRef, ServiceConfig, ServiceStatus, Status
 
 logger = logging.getLogger("marcle.integrations.plex")
 
+_MEDIA_TAGS = frozenset({"Video", "Track"})
+_PLEX_TOKEN_PATTERN = re.compile(r"(?i)X-Plex-Token=[^&\s\"'<>]+")
+
 
 class PlexProbeResult:
     def __init__(
@@ -142,7 +147,6 @@ def _plex_query_param_auth_ref(service: ServiceConfig) -> AuthRef:
 
 
 async def _probe_plex(service: ServiceConfig, auth_params: dict[str, str]) -> PlexProbeResult:
-    timeout = httpx.Timeout(timeout=config.REQUEST_TIMEOUT_SECONDS)
     identity_ok = False
     sessions_ok = False
     auth_ok = True
@@ -156,19 +160,39 @@ async def _probe_plex(service: ServiceConfig, auth_params: dict[str, str]) -> Pl
     sessions_child_tags_sample: list[str] = []
     debug_enabled = _debug_plex_sessions_enabled()
 
-    start = time.monotonic()
+    start = time.perf_counter_ns()
+    # Both endpoints are requested concurrently over the pooled client, but
+    # the sessions request is abandoned if /identity already shows the token
+    # is rejected: it would only report the same auth failure again.
+    client = get_client(verify=service.verify_ssl)
+    sessions_task = asyncio.ensure_future(_get_plex_endpoint(client, service.url, "/status/sessions", auth_params))
     try:
-        async with httpx.AsyncClient(
-            verify=service.verify_ssl,
-            timeout=timeout,
-            event_hooks=httpx_event_hooks(),
-        ) as client:
-            identity_response = await _get_plex_endpoint(client, service.url, "/identity", auth_params)
-            identity_ok = 200 <= identity_response.status_code < 300
-            if identity_response.status_code in {401, 403}:
-                auth_ok = False
-
-            sessions_response = await _get_plex_endpoint(client, service.url, "/status/sessions", auth_params)
+        identity_response: httpx.Response | BaseException = await _get_plex_endpoint(
+            client, service.url, "/identity", auth_params
+        )
+    except Exception as exc:
+        identity_response = exc
+    except BaseException:
+        sessions_task.cancel()
+        raise
+
+    sessions_response: httpx.Response | BaseException | None = None
+    if isinstance(identity_response, httpx.Response) and identity_response.status_code in {401, 403}:
+        await _discard_task(sessions_task)
+    else:
+        (sessions_response,) = await asyncio.gather(sessions_task, return_exceptions=True)
+
+    if isinstance(identity_response, BaseException):
+        sessions_error_class = _probe_error_class(identity_response)
+    else:
+        identity_ok = 200 <= identity_response.status_code < 300
+        if identity_response.status_code in {401, 403}:
+            auth_ok = False
+
+    if isinstance(sessions_response, BaseException):
+        sessions_error_class = _probe_error_class(sessions_response)
+    elif sessions_response is not None:
+        try:
             sessions_http_status = sessions_response.status_code
             sessions_ok = 200 <= sessions_response.status_code < 300
             sessions_content_type = sessions_response.headers.get("content-type")
@@ -184,14 +208,10 @@ async def _probe_plex(service: ServiceConfig, auth_params: dict[str, str]) -> Pl
                 )
                 if parse_error_class:
                     sessions_error_class = parse_error_class
-    except httpx.TimeoutException:
-        logger.warning("Timeout probing Plex endpoints")
-        sessions_error_class = "TimeoutException"
-    except Exception as exc:
-        logger.warning("Unexpected Plex probe error (%s)", exc.__class__.__name__)
-        sessions_error_class = exc.__class__.__name__
+        except Exception as exc:
+            sessions_error_class = _probe_error_class(exc)
 
-    latency = int((time.monotonic() - start) * 1000)
+    latency = (time.perf_counter_ns() - start) // 1_000_000
 
     status_value = Status.HEALTHY if identity_ok else Status.UNKNOWN
     service_status = ServiceStatus(
@@ -222,74 +242,142 @@ async def _probe_plex(service: ServiceConfig, auth_params: dict[str, str]) -> Pl
     )
 
 
+async def _discard_task(task: asyncio.Future) -> None:
+    task.cancel()
+    await asyncio.wait([task])
+    if not task.cancelled():
+        task.exception()  # finished before the cancel; mark its error retrieved
+
+
+def _probe_error_class(exc: BaseException) -> str:
+    if not isinstance(exc, Exception):
+        raise exc
+    if isinstance(exc, httpx.TimeoutException):
+        logger.warning("Timeout probing Plex endpoints")
+        return "TimeoutException"
+    logger.warning("Unexpected Plex probe error (%s)", exc.__class__.__name__)
+    return exc.__class__.__name__
+
+
 async def _get_plex_endpoint(
     client: httpx.AsyncClient,
     base_url: str,
     path: str,
     auth_params: dict[str, str],
 ) -> httpx.Response:
+    clean_url, base_query = _split_plex_url(base_url, path)
+    request_params = dict(base_query)
+    request_params.update(auth_params)
+    return await client.get(clean_url, params=request_params)
+
+
+@functools.lru_cache(maxsize=64)
+def _split_plex_url(base_url: str, path: str) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """Split ``base_url + path`` into a query-less URL and its query pairs.
+
+    Service URLs rarely change, so the split is cached per (url, path).
+    """
     full_url = base_url.rstrip("/") + path
     parsed_url = urlsplit(full_url)
     base_query = dict(parse_qsl(parsed_url.query, keep_blank_values=True))
     clean_url = urlunsplit((parsed_url.scheme, parsed_url.netloc, parsed_url.path, "", parsed_url.fragment))
-
-    request_params = dict(base_query)
-    request_params.update(auth_params)
-    return await client.get(clean_url, params=request_params)
+    return clean_url, tuple(base_query.items())
 
 
 def _parse_sessions_xml(payload: str) -> tuple[list[dict[str, Any]], str | None, str | None, list[str]]:
     if not payload or not payload.strip():
         return [], None, None, []
 
+    parser = ElementTree.XMLPullParser(events=("start", "end"))
     try:
-        root = ElementTree.fromstring(payload)
+        parser.feed(payload)
+        parser.close()
     except ElementTree.ParseError:
         logger.warning("Failed to parse Plex sessions XML")
         return [], "ParseError", None, []
 
-    root_tag = _xml_local_name(root.tag)
-    child_tags_sample = _sample_tags(root, max_items=10)
+    # One walk over the parse events replaces the old findall() passes plus a
+    # subtree scan per session for its User and Player. Sessions get their
+    # slot on the start tag so the output keeps document order.
+    root_tag: str | None = None
+    child_tags_sample: list[str] = []
+    videos: list[_SessionBuilder] = []
+    tracks: list[_SessionBuilder] = []
+    by_local_name: list[_SessionBuilder] = []
+    open_sessions: list[_SessionBuilder] = []
+    for event, node in parser.read_events():
+        tag_name = _xml_local_name(node.tag)
+        if event == "end":
+            if open_sessions and open_sessions[-1].item is node:
+                open_sessions.pop().finish()
+                node.clear()
+            continue
 
-    sessions: list[dict[str, Any]] = []
-    for item in _find_media_nodes(root):
-        tag_name = _xml_local_name(item.tag)
-        media_type = tag_name.lower()
-        session = {
-            "type": "video" if media_type == "video" else "track",
+        if root_tag is None:
+            root_tag = tag_name
+            is_root = True
+        else:
+            is_root = False
+        if tag_name and len(child_tags_sample) < 10:
+            child_tags_sample.append(tag_name)
+
+        for session in open_sessions:
+            session.observe(tag_name, node)
+        if tag_name in _MEDIA_TAGS:
+            session = _SessionBuilder(node, tag_name)
+            open_sessions.append(session)
+            by_local_name.append(session)
+            # Plain (non-namespaced) matches below the root win, Videos first.
+            if not is_root and node.tag == "Video":
+                videos.append(session)
+            elif not is_root and node.tag == "Track":
+                tracks.append(session)
+
+    media = (videos + tracks) or by_local_name
+    return [session.result for session in media], None, root_tag, child_tags_sample
+
+
+class _SessionBuilder:
+    """Collects one Video/Track session while its subtree is being walked."""
+
+    __slots__ = ("item", "media_type", "user", "player", "result")
+
+    def __init__(self, item: ElementTree.Element, tag_name: str) -> None:
+        self.item = item
+        self.media_type = tag_name.lower()
+        # First User / Player found anywhere below the session element.
+        self.user: ElementTree.Element | None = None
+        self.player: ElementTree.Element | None = None
+        self.result: dict[str, Any] = {}
+
+    def observe(self, tag_name: str, node: ElementTree.Element) -> None:
+        if tag_name == "User" and self.user is None:
+            self.user = node
+        elif tag_name == "Player" and self.player is None:
+            self.player = node
+
+    def finish(self) -> None:
+        # Attributes are copied out now, before the caller clears the element.
+        item = self.item
+        user_name = None
+        if self.user is not None:
+            user_name = _attr_or_none(self.user, "title") or _attr_or_none(self.user, "name")
+        player_name = None
+        player_state = None
+        if self.player is not None:
+            player_name = _attr_or_none(self.player, "title") or _attr_or_none(self.player, "product")
+            player_state = _attr_or_none(self.player, "state")
+        self.result = {
+            "type": "video" if self.media_type == "video" else "track",
             "title": _attr_str(item, "title") or _attr_str(item, "grandparentTitle") or "Unknown",
             "grandparent": _attr_or_none(item, "grandparentTitle"),
             "parent": _attr_or_none(item, "parentTitle"),
-            "user": _session_user(item) or _attr_or_none(item, "username"),
-            "player": _session_player(item),
-            "state": _session_state(item),
+            "user": user_name or _attr_or_none(item, "username"),
+            "player": player_name,
+            "state": player_state,
             "view_offset_ms": _attr_int(item, "viewOffset"),
             "duration_ms": _attr_int(item, "duration"),
         }
-        sessions.append(session)
-
-    return sessions, None, root_tag, child_tags_sample
-
-
-def _session_user(item: ElementTree.Element) -> str | None:
-    user = _find_first_child_by_local_name(item, "User")
-    if user is not None:
-        return _attr_or_none(user, "title") or _attr_or_none(user, "name")
-    return None
-
-
-def _session_player(item: ElementTree.Element) -> str | None:
-    player = _find_first_child_by_local_name(item, "Player")
-    if player is not None:
-        return _attr_or_none(player, "title") or _attr_or_none(player, "product")
-    return None
-
-
-def _session_state(item: ElementTree.Element) -> str | None:
-    player = _find_first_child_by_local_name(item, "Player")
-    if player is not None:
-        return _attr_or_none(player, "state")
-    return None
 
 
 def _attr_str(item: ElementTree.Element, key: str) -> str | None:
@@ -320,45 +408,17 @@ def _xml_local_name(tag: str) -> str:
     return tag
 
 
-def _find_media_nodes(root: ElementTree.Element) -> list[ElementTree.Element]:
-    direct_matches = root.findall(".//Video") + root.findall(".//Track")
-    if direct_matches:
-        return direct_matches
-
-    matches: list[ElementTree.Element] = []
-    for node in root.iter():
-        tag_name = _xml_local_name(node.tag)
-        if tag_name in {"Video", "Track"}:
-            matches.append(node)
-    return matches
-
-
-def _find_first_child_by_local_name(item: ElementTree.Element, local_name: str) -> ElementTree.Element | None:
-    for child in item.iter():
-        if child is item:
-            continue
-        if _xml_local_name(child.tag) == local_name:
-            return child
-    return None
-
-
-def _sample_tags(root: ElementTree.Element, max_items: int) -> list[str]:
-    tags: list[str] = []
-    for node in root.iter():
-        tag_name = _xml_local_name(node.tag)
-        if not tag_name:
-            continue
-        tags.append(tag_name)
-        if len(tags) >= max_items:
-            break
-    return tags
-
-
+@functools.lru_cache(maxsize=1)
 def _debug_plex_sessions_enabled() -> bool:
-    return os.getenv("DEBUG_PLEX_SESSIONS", "").strip().lower() in {"1", "true", "yes", "on"}
+    """Read DEBUG_PLEX_SESSIONS once; it is checked on every probe.
+
+    The result is cached for the life of the process, so changing the variable
+    needs a restart. Tests that set it must call ``cache_clear()``.
+    """
+    return os.getenv("DEBUG_PLEX_SESSIONS", "").strip().lower() in TRUTHY_ENV_VALUES
 
 
 def _redact_plex_token(value: str | None) -> str | None:
     if value is None:
         return None
-    return re.sub(r"(?i)X-Plex-Token=[^&\\s\"'<>]+", "X-Plex-Token=REDACTED", value)
+    return _PLEX_TOKEN_PATTERN.sub("X-Plex-Token=REDACTED", value)
@@ -43,6 +43,7 @@ _FILTER_LOGGERS = (
     "marcle",
 )
 _HTTP_LOGGER = logging.getLogger("marcle.http")
+_REDACTED_ATTR = "_marcle_redacted"
 
 
 def _normalize_query_key(key: str) -> str:
@@ -101,18 +102,39 @@ def redact_text(value: str | None) -> str | None:
     if value is None:
         return None
     text = str(value)
-
-    text = _URL_PATTERN.sub(lambda match: redact_url(match.group(0)), text)
-    text = _JSON_SECRET_PATTERN.sub(r"\1***\3", text)
-    text = _KV_SECRET_PATTERN.sub(r"\1***", text)
-    text = _BEARER_PATTERN.sub("Bearer ***", text)
+    has_bearer = "bearer" in text.lower()
+    # Fast path for the common log line: every pattern needs a ':' or '=',
+    # except a bearer token.
+    if ":" not in text and "=" not in text and not has_bearer:
+        return text
+
+    # The passes run in order because each later one also sees what the
+    # earlier ones produced (e.g. a key=value that a URL cut in half), so they
+    # are not fused into one alternation. Each is skipped, though, when the
+    # current text lacks a character every match of that pattern needs.
+    if "://" in text:
+        text = _URL_PATTERN.sub(_redact_url_match, text)
+    if '"' in text:
+        text = _JSON_SECRET_PATTERN.sub(r"\1***\3", text)
+    if "=" in text or ":" in text:
+        text = _KV_SECRET_PATTERN.sub(r"\1***", text)
+    if has_bearer:
+        text = _BEARER_PATTERN.sub("Bearer ***", text)
     return text
 
 
+def _redact_url_match(match: re.Match[str]) -> str:
+    return redact_url(match.group(0))
+
+
 class SecretRedactionFilter(logging.Filter):
     """Logging filter that redacts secrets before records are emitted."""
 
     def filter(self, record: logging.LogRecord) -> bool:
+        # A propagating record meets this filter on its own logger and on each
+        # handler up the tree; redact it on the first pass only.
+        if getattr(record, _REDACTED_ATTR, False):
+            return True
         try:
             message = record.getMessage()
         except Exception:
@@ -121,8 +143,11 @@ class SecretRedactionFilter(logging.Filter):
         record.msg = redact_text(message) or ""
         record.args = ()
         if record.exc_info:
-            exc_text = "".join(traceback.format_exception(*record.exc_info))
+            # Reuse a traceback an earlier, unfiltered handler's formatter
+            # already rendered instead of formatting it again.
+            exc_text = record.exc_text or "".join(traceback.format_exception(*record.exc_info))
             record.exc_text = redact_text(exc_text)
+        setattr(record, _REDACTED_ATTR, True)
         return True
 
 
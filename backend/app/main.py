@@ -9,15 +9,17 @@ from contextlib import asynccontextmanager, suppress
 from datetime import datetime, timezone
 from typing import Any, Mapping
 
-from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response, status
 from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 import httpx
+from pydantic import TypeAdapter
 
 from app import config
 from app.auth import InvalidCredentialFormatError, MissingCredentialError, build_auth_headers, build_auth_params
 from app.audit_log import audit_log_store
 from app.config_store import config_store
+from app.http_client import close_clients as close_http_clients
 from app.integrations.plex import check_plex_service
 from app.log_redact import httpx_event_hooks, install_log_redaction
 from app.models import (
@@ -37,7 +39,7 @@ from app.models import (
 )
 from app.notifications_store import notifications_store
 from app.observations_store import observations_store
-from app.services import http_check
+from app.services import clear_check_cache, http_check
 from app.state import state
 
 # --- Logging ---
@@ -75,6 +77,7 @@ CHECK_TYPE_PROFILES: dict[str, dict] = {
 MAX_INCIDENTS_LIMIT = 200
 DEFAULT_SERVICE_INCIDENTS_LIMIT = 20
 MAX_ADMIN_AUDIT_LIMIT = 500
+_AUDIT_ENTRIES_ADAPTER = TypeAdapter(list[AdminAuditEntry])
 
 
 def _compute_overall(services) -> OverallStatus:
@@ -212,7 +215,7 @@ async def _apply_observations(payload: Mapping[str, Any], observed_at: datetime)
 async def _refresh_once() -> tuple[dict, datetime, int, dict[Status, int]]:
     """Run all checks concurrently and return json-encoded payload plus metrics."""
     refresh_started_at = datetime.now(timezone.utc)
-    start = time.monotonic()
+    start = time.perf_counter_ns()
     services_to_check = _enabled_services()
 
     if services_to_check:
@@ -224,7 +227,7 @@ async def _refresh_once() -> tuple[dict, datetime, int, dict[Status, int]]:
     else:
         services = []
 
-    elapsed = int((time.monotonic() - start) * 1000)
+    elapsed = (time.perf_counter_ns() - start) // 1_000_000
     payload = StatusResponse(
         generated_at=datetime.now(timezone.utc),
         overall_status=_compute_overall(services),
@@ -287,6 +290,7 @@ async def _refresh_loop() -> None:
 
 
 async def _invalidate_and_refresh() -> None:
+    clear_check_cache()
     await _set_startup_payload()
     await state.mark_needs_refresh()
 
@@ -311,6 +315,7 @@ async def _lifespan(_: FastAPI):
         refresh_task.cancel()
         with suppress(asyncio.CancelledError):
             await refresh_task
+        await close_http_clients()
 
 
 # --- App ---
@@ -628,7 +633,11 @@ async def get_admin_audit(
     _: None = Depends(_require_admin),
 ):
     bounded_limit = min(limit, MAX_ADMIN_AUDIT_LIMIT)
-    return await asyncio.to_thread(audit_log_store.recent, bounded_limit)
+    entries = await asyncio.to_thread(audit_log_store.recent, bounded_limit)
+    # Validate and encode in one pydantic-core pass instead of letting FastAPI
+    # validate, convert to plain dicts and then json.dumps the result.
+    content = _AUDIT_ENTRIES_ADAPTER.dump_json(_AUDIT_ENTRIES_ADAPTER.validate_python(entries))
+    return Response(content=content, media_type="application/json")
 
 
 @app.get("/api/admin/notifications", response_model=AdminNotificationsConfigResponse)
@@ -22,11 +22,18 @@ from app import config as app_config
 from app.ask_db import (
     DEFAULT_STARTING_POINTS,
     POINTS_PER_QUESTION,
+    batched_writes,
     get_db,
 )
 from app.ask_services.discord import post_question_to_discord
-from app.ask_services.email import send_answer_email, send_custom_email, send_custom_email_result
-from app.ask_services.llm import generate_local_answer_text, generate_openai_answer_text
+from app.ask_services.email import (
+    close_smtp_session,
+    run_in_smtp_executor,
+    send_answer_email,
+    send_custom_email,
+    send_custom_email_result,
+)
+from app.ask_services.llm import MAX_QUESTION_CHARS, generate_local_answer_text, generate_openai_answer_text
 from app.ask_services.google_oauth import GOOGLE_REDIRECT_URL, exchange_code, get_login_url, get_user_info
 from app.discord_client import post_answer_to_discord
 from app.env_utils import get_env
@@ -97,7 +104,7 @@ class DiscordQuestionRequest(BaseModel):
     author_id: str | None = Field(default=None, max_length=128)
     author_name: str | None = Field(default=None, max_length=255)
     author_email: str | None = Field(default=None, max_length=320)
-    content: str = Field(..., min_length=1, max_length=10000)
+    content: str = Field(..., min_length=1, max_length=MAX_QUESTION_CHARS)
     timestamp: str | None = Field(default=None, max_length=100)
 
     @model_validator(mode="after")
@@ -414,7 +421,7 @@ def _release_sse_stream(session_token: str, client_ip: str) -> None:
 
 
 def _fetch_question_for_user_sync(question_id: int, user_id: int) -> dict[str, Any] | None:
-    with get_db() as conn:
+    with get_db(readonly=True) as conn:
         row = conn.execute(
             "SELECT * FROM questions WHERE id = ? AND user_id = ?",
             (question_id, user_id),
@@ -423,7 +430,7 @@ def _fetch_question_for_user_sync(question_id: int, user_id: int) -> dict[str, A
 
 
 def _fetch_question_by_id_sync(question_id: int) -> dict[str, Any] | None:
-    with get_db() as conn:
+    with get_db(readonly=True) as conn:
         row = conn.execute("SELECT * FROM questions WHERE id = ?", (question_id,)).fetchone()
         return dict(row) if row else None
 
@@ -760,7 +767,7 @@ async def _handle_discord_human_answer(payload: dict[str, str]) -> None:
                 return None, "already_answered"
 
             now = datetime.now(timezone.utc).isoformat()
-            conn.execute(
+            cursor = conn.execute(
                 "UPDATE questions SET answer_text = ?, answered_at = ?, answered_by = 'human', status = 'answered', "
                 "discord_answer_message_id = ?, "
                 "discord_thread_id = COALESCE(?, discord_thread_id), "
@@ -777,7 +784,7 @@ async def _handle_discord_human_answer(payload: dict[str, str]) -> None:
                     question["id"],
                 ),
             )
-            if conn.execute("SELECT changes()").fetchone()[0] == 0:
+            if cursor.rowcount == 0:
                 conn.rollback()
                 return None, "update_conflict"
             conn.commit()
@@ -807,7 +814,7 @@ async def _process_fallback_candidates_once() -> None:
     now_iso = now.isoformat()
 
     def _fetch_candidates():
-        with get_db() as conn:
+        with get_db(readonly=True) as conn:
             rows = conn.execute(
                 "SELECT id, question_text, created_at, deadline_at, human_deadline_at, openai_deadline_at, "
                 "local_llm_attempted_at, openai_attempted_at, discord_thread_id, discord_channel_id, discord_message_id "
@@ -821,7 +828,7 @@ async def _process_fallback_candidates_once() -> None:
     def _claim_stage(question_id: int, stage: str, human_deadline_iso: str, openai_deadline_iso: str) -> bool:
         with get_db() as conn:
             if stage == "local":
-                conn.execute(
+                cursor = conn.execute(
                     "UPDATE questions "
                     "SET local_llm_attempted_at = ?, "
                     "human_deadline_at = COALESCE(human_deadline_at, ?), "
@@ -831,7 +838,7 @@ async def _process_fallback_candidates_once() -> None:
                     (now_iso, human_deadline_iso, openai_deadline_iso, human_deadline_iso, question_id),
                 )
             else:
-                conn.execute(
+                cursor = conn.execute(
                     "UPDATE questions "
                     "SET openai_attempted_at = ?, "
                     "openai_deadline_at = COALESCE(openai_deadline_at, ?), "
@@ -840,20 +847,20 @@ async def _process_fallback_candidates_once() -> None:
                     "AND local_llm_attempted_at IS NOT NULL AND openai_attempted_at IS NULL",
                     (now_iso, openai_deadline_iso, openai_deadline_iso, question_id),
                 )
-            changed = conn.execute("SELECT changes()").fetchone()[0]
+            changed = cursor.rowcount
             conn.commit()
             return changed > 0
 
     def _save_answer(question_id: int, answer_text: str, answered_by: str) -> bool:
         answered_at = datetime.now(timezone.utc).isoformat()
         with get_db() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 "UPDATE questions "
                 "SET answer_text = ?, answered_at = ?, answered_by = ?, status = 'answered' "
                 "WHERE id = ? AND answer_text IS NULL AND status = 'pending'",
                 (answer_text, answered_at, answered_by, question_id),
             )
-            changed = conn.execute("SELECT changes()").fetchone()[0]
+            changed = cursor.rowcount
             conn.commit()
             return changed > 0
 
@@ -981,6 +988,7 @@ async def stop_ask_background_workers() -> None:
     from app.discord_client import stop_discord_client
 
     await stop_discord_client()
+    await run_in_smtp_executor(close_smtp_session)
 
 
 # --- Auth Endpoints ---
@@ -1128,7 +1136,7 @@ async def get_me(
     user_id = session["user_id"]
 
     def _fetch_user():
-        with get_db() as conn:
+        with get_db(readonly=True) as conn:
             row = conn.execute("SELECT * FROM users WHERE id = ?", (user_id,)).fetchone()
             return dict(row) if row else None
 
@@ -1179,7 +1187,7 @@ async def submit_question(
     _check_rate_limit(user_id)
 
     def _create_question():
-        with get_db() as conn:
+        with batched_writes() as conn:
             user = conn.execute("SELECT id, points, name, email FROM users WHERE id = ?", (user_id,)).fetchone()
             if not user:
                 return None, "User not found"
@@ -1192,12 +1200,12 @@ async def submit_question(
                 if user["points"] < POINTS_PER_QUESTION:
                     return None, "Insufficient points"
 
-                conn.execute(
+                cursor = conn.execute(
                     "UPDATE users SET points = points - ?, updated_at = ? WHERE id = ? AND points >= ?",
                     (POINTS_PER_QUESTION, datetime.now(timezone.utc).isoformat(), user_id, POINTS_PER_QUESTION),
                 )
                 # Verify the update actually happened (race condition guard)
-                if conn.execute("SELECT changes()").fetchone()[0] == 0:
+                if cursor.rowcount == 0:
                     conn.rollback()
                     return None, "Insufficient points (race)"
 
@@ -1216,7 +1224,6 @@ async def submit_question(
                     openai_deadline_at.isoformat(),
                 ),
             )
-            conn.commit()
 
             question_id = cursor.lastrowid
             if ASK_POINTS_ENABLED:
@@ -1306,7 +1313,7 @@ async def list_questions(
     user_id = session["user_id"]
 
     def _fetch():
-        with get_db() as conn:
+        with get_db(readonly=True) as conn:
             rows = conn.execute(
                 "SELECT * FROM questions WHERE user_id = ? ORDER BY created_at DESC LIMIT ?",
                 (user_id, limit),
@@ -1393,7 +1400,7 @@ async def upsert_discord_question(
     """Upsert a question record from a Discord message for n8n."""
 
     def _upsert():
-        with get_db() as conn:
+        with batched_writes() as conn:
             created_at = datetime.now(timezone.utc)
             now = created_at.isoformat()
             human_deadline_at, openai_deadline_at = _build_deadlines(created_at)
@@ -1444,7 +1451,6 @@ async def upsert_discord_question(
                         existing["id"],
                     ),
                 )
-                conn.commit()
                 return existing["id"], "updated"
 
             cursor = conn.execute(
@@ -1463,7 +1469,6 @@ async def upsert_discord_question(
                     openai_deadline_at.isoformat(),
                 ),
             )
-            conn.commit()
             return cursor.lastrowid, "created"
 
     question_id, result = await asyncio.to_thread(_upsert)
@@ -1513,7 +1518,7 @@ async def attach_discord_answer(
                 return None, "Question already answered", status.HTTP_409_CONFLICT
 
             now = datetime.now(timezone.utc).isoformat()
-            conn.execute(
+            cursor = conn.execute(
                 "UPDATE questions SET answer_text = ?, answered_at = ?, status = 'answered', answered_by = 'human', "
                 "discord_answer_message_id = ?, "
                 "discord_thread_id = COALESCE(?, discord_thread_id), "
@@ -1530,7 +1535,7 @@ async def attach_discord_answer(
                     question["id"],
                 ),
             )
-            if conn.execute("SELECT changes()").fetchone()[0] == 0:
+            if cursor.rowcount == 0:
                 conn.rollback()
                 return None, "Question already answered", status.HTTP_409_CONFLICT
             conn.commit()
@@ -1555,7 +1560,7 @@ async def attach_discord_answer(
         thread_permalink=body.thread_permalink,
         answer_permalink=body.answer_permalink,
     )
-    email_ok = await asyncio.to_thread(
+    email_ok = await run_in_smtp_executor(
         send_custom_email,
         to_email=question_data["email"],
         subject=subject,
@@ -1620,7 +1625,7 @@ async def submit_answer(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=error)
 
     # Send email to user (best-effort)
-    email_ok = await asyncio.to_thread(
+    email_ok = await run_in_smtp_executor(
         send_answer_email,
         to_email=question_data["email"],
         to_name=question_data["name"],
@@ -1648,7 +1653,7 @@ async def admin_list_users(request: Request):
     _require_admin_token(request)
 
     def _fetch():
-        with get_db() as conn:
+        with get_db(readonly=True) as conn:
             rows = conn.execute("SELECT * FROM users ORDER BY created_at DESC").fetchall()
             return [dict(r) for r in rows]
 
@@ -1712,7 +1717,7 @@ async def admin_email_test(body: AdminEmailTestRequest, request: Request):
 </body>
 </html>"""
 
-    ok, error = await asyncio.to_thread(
+    ok, error = await run_in_smtp_executor(
         send_custom_email_result,
         to_email=body.to,
         subject=subject,
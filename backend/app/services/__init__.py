@@ -1,5 +1,6 @@
 """Shared utilities for service health checks."""
 
+import asyncio
 import time
 import logging
 from typing import Optional, Iterable
@@ -9,13 +10,23 @@ import httpx
 
 from app import config
 from app.auth import InvalidCredentialFormatError, MissingCredentialError, build_auth_headers, build_auth_params
-from app.log_redact import httpx_event_hooks
+from app.http_client import get_client
 from app.models import AuthRef, ServiceStatus, Status, ServiceGroup
 
 logger = logging.getLogger("marcle.services")
 
 TIMEOUT = httpx.Timeout(timeout=config.REQUEST_TIMEOUT_SECONDS)
 
+# Recent results keyed by the full request so bursts of refreshes collapse to
+# one upstream hit; concurrent callers for the same key share one in-flight task.
+# Entries hold their monotonic expiry time alongside the result.
+_check_cache: dict[tuple, tuple[float, ServiceStatus]] = {}
+_check_inflight: dict[tuple, asyncio.Task] = {}
+
+
+def clear_check_cache() -> None:
+    _check_cache.clear()
+
 
 async def http_check(
     *,
@@ -31,8 +42,13 @@ async def http_check(
     description: Optional[str] = None,
     icon: Optional[str] = None,
     healthy_status_codes: Optional[Iterable[int]] = None,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> ServiceStatus:
-    """Generic HTTP health check. Returns ServiceStatus, never raises."""
+    """Generic HTTP health check. Returns ServiceStatus, never raises.
+
+    Pass ``client`` to issue sibling checks over one connection pool; it
+    defaults to the shared client for ``verify_ssl``.
+    """
     if not url:
         return ServiceStatus(
             id=id, name=name, group=group, status=Status.UNKNOWN,
@@ -75,15 +91,68 @@ async def http_check(
             icon=icon,
         )
 
-    start = time.monotonic()
+    cache_key = (
+        id,
+        full_url,
+        verify_ssl,
+        frozenset(expected_codes),
+        tuple(sorted(request_headers.items())),
+        tuple(sorted(request_params.items())),
+    )
+    ttl = config.CHECK_CACHE_TTL_SECONDS
+    if ttl > 0:
+        cached = _check_cache.get(cache_key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+    task = _check_inflight.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(
+            _run_http_check(
+                id=id,
+                name=name,
+                group=group,
+                url=url,
+                full_url=full_url,
+                request_headers=request_headers,
+                request_params=request_params,
+                verify_ssl=verify_ssl,
+                description=description,
+                icon=icon,
+                expected_codes=expected_codes,
+                client=client,
+            )
+        )
+        _check_inflight[cache_key] = task
+        task.add_done_callback(lambda _: _check_inflight.pop(cache_key, None))
+
+    result = await asyncio.shield(task)
+    if ttl > 0:
+        _check_cache[cache_key] = (time.monotonic() + ttl, result)
+    return result
+
+
+async def _run_http_check(
+    *,
+    id: str,
+    name: str,
+    group: ServiceGroup,
+    url: str,
+    full_url: str,
+    request_headers: dict,
+    request_params: dict[str, str],
+    verify_ssl: bool,
+    description: Optional[str],
+    icon: Optional[str],
+    expected_codes: set[int],
+    client: Optional[httpx.AsyncClient],
+) -> ServiceStatus:
+    start = time.perf_counter_ns()
     try:
-        async with httpx.AsyncClient(
-            verify=verify_ssl,
-            timeout=TIMEOUT,
-            event_hooks=httpx_event_hooks(),
-        ) as client:
-            resp = await client.get(full_url, headers=request_headers, params=request_params)
-        latency = int((time.monotonic() - start) * 1000)
+        if client is None:
+            client = get_client(verify=verify_ssl)
+        resp = await client.get(full_url, headers=request_headers, params=request_params, timeout=TIMEOUT)
+        latency = (time.perf_counter_ns() - start) // 1_000_000
 
         status = Status.HEALTHY if resp.status_code in expected_codes else Status.DEGRADED
 
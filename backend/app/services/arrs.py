@@ -3,14 +3,33 @@
 import asyncio
 import logging
 
+import httpx
+
 from app import config
+from app.http_client import get_client
 from app.models import AuthRef, ServiceGroup, ServiceStatus, Status
 from app.services import http_check
 
 logger = logging.getLogger("marcle.services.arrs")
 
 
-async def _check_radarr() -> ServiceStatus:
+def _aggregate_pair(left: Status, right: Status) -> Status:
+    statuses = {left, right}
+    if Status.DOWN in statuses:
+        return Status.DOWN
+    if Status.DEGRADED in statuses or Status.UNKNOWN in statuses:
+        return Status.DEGRADED
+    return Status.HEALTHY
+
+
+# Pairwise precedence table; folding it over any number of statuses gives the
+# aggregate (DOWN > DEGRADED/UNKNOWN > HEALTHY).
+_AGG: dict[tuple[Status, Status], Status] = {
+    (left, right): _aggregate_pair(left, right) for left in Status for right in Status
+}
+
+
+async def _check_radarr(client: httpx.AsyncClient) -> ServiceStatus:
     return await http_check(
         id="radarr",
         name="Radarr",
@@ -19,10 +38,11 @@ async def _check_radarr() -> ServiceStatus:
         path="/api/v3/health",
         auth_ref=AuthRef(scheme="header", env="RADARR_API_KEY", header_name="X-Api-Key"),
         icon="radarr.svg",
+        client=client,
     )
 
 
-async def _check_sonarr() -> ServiceStatus:
+async def _check_sonarr(client: httpx.AsyncClient) -> ServiceStatus:
     return await http_check(
         id="sonarr",
         name="Sonarr",
@@ -31,21 +51,17 @@ async def _check_sonarr() -> ServiceStatus:
         path="/api/v3/health",
         auth_ref=AuthRef(scheme="header", env="SONARR_API_KEY", header_name="X-Api-Key"),
         icon="sonarr.svg",
+        client=client,
     )
 
 
 async def check_arrs() -> ServiceStatus:
     """Aggregated check. Healthy only if both are healthy."""
-    radarr, sonarr = await asyncio.gather(_check_radarr(), _check_sonarr())
+    # Both checks share one pool so a common reverse proxy is dialed once.
+    client = get_client(verify=False)
+    radarr, sonarr = await asyncio.gather(_check_radarr(client), _check_sonarr(client))
 
-    statuses = {radarr.status, sonarr.status}
-
-    if Status.DOWN in statuses:
-        agg_status = Status.DOWN
-    elif Status.DEGRADED in statuses or Status.UNKNOWN in statuses:
-        agg_status = Status.DEGRADED
-    else:
-        agg_status = Status.HEALTHY
+    agg_status = _AGG[(radarr.status, sonarr.status)]
 
     # Average latency where available
     latencies = [s.latency_ms for s in (radarr, sonarr) if s.latency_ms is not None]
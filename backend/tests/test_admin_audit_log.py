@@ -1,7 +1,10 @@
 import asyncio
+import threading
+import time
 
 from fastapi.testclient import TestClient
 
+import app.audit_log as audit_log_module
 import app.main as main_module
 from app.audit_log import AuditLogStore
 from app.main import app
@@ -230,3 +233,90 @@ def test_audit_write_failure_does_not_break_admin_action(monkeypatch):
     assert list_response.status_code == 200
     ids = {service["id"] for service in list_response.json()["services"]}
     assert "svc-b" in ids
+
+
+def test_concurrent_audit_appends_share_synced_writes(monkeypatch, tmp_path):
+    audit_store = AuditLogStore(str(tmp_path / "audit.log"), max_bytes=1024 * 1024)
+    synced_writes = []
+    original_write = audit_store._write_synced_unlocked
+
+    def _slow_synced_write(fd, data):
+        synced_writes.append(data)
+        time.sleep(0.02)
+        original_write(fd, data)
+
+    monkeypatch.setattr(audit_store, "_write_synced_unlocked", _slow_synced_write)
+
+    threads = [
+        threading.Thread(target=audit_store.append, args=({"action": "toggle", "n": index},))
+        for index in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    entries = audit_store.recent(100)
+    assert sorted(entry["n"] for entry in entries) == list(range(20))
+    assert 1 <= len(synced_writes) < 20
+
+
+def test_audit_append_falls_back_to_fsync_without_dsync_writes(monkeypatch, tmp_path):
+    audit_store = AuditLogStore(str(tmp_path / "audit.log"), max_bytes=1024 * 1024)
+    fsync_calls = []
+    original_fsync = audit_log_module.os.fsync
+
+    def _unsupported_pwritev(*_args):
+        raise OSError(audit_log_module.errno.EOPNOTSUPP, "Operation not supported")
+
+    def _counting_fsync(fd):
+        fsync_calls.append(fd)
+        original_fsync(fd)
+
+    monkeypatch.setattr(audit_store, "_dsync_writes", True)
+    monkeypatch.setattr(audit_log_module, "_RWF_DSYNC", 2)
+    monkeypatch.setattr(audit_log_module.os, "pwritev", _unsupported_pwritev, raising=False)
+    monkeypatch.setattr(audit_log_module.os, "fsync", _counting_fsync)
+
+    audit_store.append({"action": "create", "n": 1})
+    audit_store.append({"action": "delete", "n": 2})
+
+    assert [entry["n"] for entry in audit_store.recent(10)] == [2, 1]
+    assert len(fsync_calls) == 2
+    assert audit_store._dsync_writes is False
+
+
+def test_audit_log_trims_to_max_bytes_keeping_newest_entries(tmp_path):
+    audit_path = tmp_path / "audit.log"
+    audit_store = AuditLogStore(str(audit_path), max_bytes=1024)
+
+    for index in range(100):
+        audit_store.append({"action": "toggle", "n": index})
+
+    assert audit_path.stat().st_size <= 1024
+    entries = audit_store.recent(500)
+    assert entries[0]["n"] == 99
+    assert [entry["n"] for entry in entries] == list(range(99, 99 - len(entries), -1))
+    assert audit_store._size == audit_path.stat().st_size
+
+
+def test_audit_log_trim_leaves_headroom_before_next_rewrite(monkeypatch, tmp_path):
+    audit_path = tmp_path / "audit.log"
+    audit_store = AuditLogStore(str(audit_path), max_bytes=4096)
+    rewrites: list[int] = []
+    original_write = audit_log_module.atomic_write_bytes
+
+    def _counting_write(path, data):
+        rewrites.append(len(data))
+        original_write(path, data)
+
+    monkeypatch.setattr(audit_log_module, "atomic_write_bytes", _counting_write)
+
+    for index in range(400):
+        audit_store.append({"action": "toggle", "n": index})
+
+    entry_bytes = len(b'{"action":"toggle","n":100}\n')
+    assert rewrites and all(size <= 3072 for size in rewrites)
+    # Each rewrite frees about a quarter of max_bytes, not a single entry.
+    assert len(rewrites) <= (400 * entry_bytes) // (1024 - entry_bytes)
+    assert audit_path.stat().st_size <= 4096
@@ -0,0 +1,168 @@
+import asyncio
+
+import httpx
+import pytest
+
+import app.ask_services.discord as discord_module
+
+
+@pytest.fixture(autouse=True)
+def _reset_discord_state(monkeypatch):
+    monkeypatch.setattr(discord_module, "_thread_cache", {})
+    monkeypatch.setattr(discord_module, "_thread_lookups", {})
+    monkeypatch.setattr(discord_module, "_thread_creations", {})
+    monkeypatch.setattr(discord_module, "_rate_limited_until", 0.0)
+
+
+def _fetch_thread_ids(handler, rounds: list[int]) -> list[list[str | None]]:
+    """Run each round of concurrent lookups for the same message on one client."""
+
+    async def _run():
+        results = []
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            for concurrency in rounds:
+                results.append(
+                    await asyncio.gather(
+                        *(
+                            discord_module._fetch_message_thread_id(
+                                client=client, channel_id="chan-1", message_id="msg-1"
+                            )
+                            for _ in range(concurrency)
+                        )
+                    )
+                )
+        return results
+
+    return asyncio.run(_run())
+
+
+def test_concurrent_thread_lookups_share_one_request():
+    requested: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        return httpx.Response(200, json={"id": "msg-1", "thread": {"id": "thread-1"}})
+
+    assert _fetch_thread_ids(_handler, [2]) == [["thread-1", "thread-1"]]
+    assert requested == [f"{discord_module._DISCORD_API_ROOT}/channels/chan-1/messages/msg-1"]
+    assert discord_module._thread_lookups == {}
+
+
+def test_cached_thread_id_is_reused():
+    requested: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        return httpx.Response(200, json={"id": "msg-1", "thread": {"id": "thread-1"}})
+
+    assert _fetch_thread_ids(_handler, [1, 1]) == [["thread-1"], ["thread-1"]]
+    assert len(requested) == 1
+
+
+def test_failed_thread_lookup_is_not_cached():
+    responses = [
+        httpx.Response(404, json={"message": "Unknown Message"}),
+        httpx.Response(200, json={"id": "msg-1", "thread": {"id": "thread-1"}}),
+    ]
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    assert _fetch_thread_ids(_handler, [1]) == [[None]]
+    assert discord_module._thread_cache == {}
+    assert discord_module._thread_lookups == {}
+
+    # The next lookup asks Discord again instead of reusing the failure.
+    assert _fetch_thread_ids(_handler, [1]) == [["thread-1"]]
+    assert responses == []
+
+
+def _send_requests(monkeypatch, handler, count: int) -> list[float]:
+    """Issue ``count`` Discord requests and return the rate-limit waits taken."""
+    sleeps: list[float] = []
+
+    async def _fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(discord_module.asyncio, "sleep", _fake_sleep)
+
+    async def _run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            for _ in range(count):
+                await discord_module._discord_request(client, "GET", "https://discord.test/api/channels/1")
+
+    asyncio.run(_run())
+    return sleeps
+
+
+def test_exhausted_rate_limit_bucket_delays_next_request(monkeypatch):
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "1.5"})
+
+    sleeps = _send_requests(monkeypatch, _handler, 2)
+
+    assert len(sleeps) == 1
+    assert 1.0 < sleeps[0] <= 1.5
+
+
+def test_rate_limit_wait_is_capped(monkeypatch):
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "120"})
+
+    sleeps = _send_requests(monkeypatch, _handler, 2)
+
+    assert len(sleeps) == 1
+    assert discord_module.DISCORD_MAX_RATE_LIMIT_WAIT_SECONDS - 1 < sleeps[0]
+    assert sleeps[0] <= discord_module.DISCORD_MAX_RATE_LIMIT_WAIT_SECONDS
+
+
+def test_remaining_rate_limit_budget_does_not_wait(monkeypatch):
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"X-RateLimit-Remaining": "4", "X-RateLimit-Reset-After": "1.5"})
+
+    assert _send_requests(monkeypatch, _handler, 3) == []
+
+
+def _create_thread(monkeypatch, handler) -> str | None:
+    monkeypatch.setattr(discord_module, "DISCORD_BOT_TOKEN", "bot-token")
+
+    async def _run() -> str | None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await discord_module._create_discord_thread(
+                client=client, channel_id="chan-1", message_id="msg-1", question_id=7
+            )
+
+    return asyncio.run(_run())
+
+
+def test_existing_thread_error_reuses_thread(monkeypatch):
+    requested: list[tuple[str, str]] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requested.append((request.method, request.url.path.rsplit("/", 1)[-1]))
+        if request.method == "POST":
+            return httpx.Response(400, json={"code": 160004, "message": "A thread has already been created"})
+        return httpx.Response(200, json={"id": "msg-1", "thread": {"id": "thread-1"}})
+
+    assert _create_thread(monkeypatch, _handler) == "thread-1"
+    assert requested == [("POST", "threads"), ("GET", "msg-1")]
+
+
+def test_other_thread_errors_skip_body_decoding(monkeypatch):
+    requested: list[str] = []
+    decoded: list[bytes] = []
+    original_json = httpx.Response.json
+
+    def _counting_json(self, **kwargs):
+        decoded.append(self.content)
+        return original_json(self, **kwargs)
+
+    monkeypatch.setattr(httpx.Response, "json", _counting_json)
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.method)
+        return httpx.Response(403, json={"code": 50013, "message": "Missing Permissions"})
+
+    assert _create_thread(monkeypatch, _handler) is None
+    assert requested == ["POST"]
+    assert decoded == []
@@ -0,0 +1,27 @@
+import asyncio
+
+from app.async_utils import LoopSemaphore
+
+
+def test_loop_semaphore_limits_concurrency_on_each_event_loop():
+    semaphore = LoopSemaphore(1)
+
+    async def _contend() -> int:
+        active = 0
+        peak = 0
+
+        async def _worker() -> None:
+            nonlocal active, peak
+            async with semaphore:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0)
+                active -= 1
+
+        await asyncio.gather(*(_worker() for _ in range(3)))
+        return peak
+
+    # A plain asyncio.Semaphore that had waiters on the first loop raises
+    # RuntimeError when contended on the second.
+    assert asyncio.run(_contend()) == 1
+    assert asyncio.run(_contend()) == 1
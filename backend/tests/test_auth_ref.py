@@ -4,8 +4,10 @@ from types import SimpleNamespace
 import pytest
 from fastapi.testclient import TestClient
 
+from app.auth import InvalidCredentialFormatError, build_auth_headers
 from app.main import app
 from app.models import AuthRef, ServiceConfig, ServiceGroup
+from app.services import clear_check_cache
 from app.state import state
 import app.main as main_module
 
@@ -41,6 +43,7 @@ def _service_with_auth(auth_ref: AuthRef | None, check_type: str = "generic") ->
 
 
 def _reset_state() -> None:
+    clear_check_cache()
     asyncio.run(state.clear_cached_payload())
 
 
@@ -188,3 +191,17 @@ def test_auth_ref_query_param_requires_param_name():
     auth_ref = AuthRef(scheme="query_param", env="SOME_ENV", param_name="apikey")
     assert auth_ref.param_name == "apikey"
     assert auth_ref.header_name is None
+
+
+def test_build_auth_headers_follows_rotated_credentials(monkeypatch):
+    auth_ref = AuthRef(scheme="basic", env="AUTH_TEST_BASIC")
+    monkeypatch.setenv("AUTH_TEST_BASIC", "user:first")
+    first = build_auth_headers(auth_ref)
+    assert build_auth_headers(auth_ref) == first
+
+    monkeypatch.setenv("AUTH_TEST_BASIC", "user:second")
+    assert build_auth_headers(auth_ref) == {"Authorization": "Basic dXNlcjpzZWNvbmQ="}
+
+    monkeypatch.setenv("AUTH_TEST_BASIC", "missing-colon")
+    with pytest.raises(InvalidCredentialFormatError):
+        build_auth_headers(auth_ref)
@@ -0,0 +1,156 @@
+import json
+
+import pytest
+
+from app.config_store import ConfigStore
+from app.models import ServiceConfig, ServiceGroup
+
+
+def _service(service_id: str, enabled: bool = True) -> ServiceConfig:
+    return ServiceConfig(
+        id=service_id,
+        name=f"Service {service_id}",
+        group=ServiceGroup.CORE,
+        url="https://example.test",
+        check_type="generic",
+        enabled=enabled,
+    )
+
+
+def _write_config(path, services: list[ServiceConfig]) -> None:
+    payload = {"services": [service.model_dump(mode="json", exclude_none=True) for service in services]}
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _count_reads(monkeypatch, store: ConfigStore) -> list[int]:
+    reads: list[int] = []
+    original_read = store._read_services_unlocked
+
+    def _counting_read():
+        reads.append(1)
+        return original_read()
+
+    monkeypatch.setattr(store, "_read_services_unlocked", _counting_read)
+    return reads
+
+
+def test_list_services_reuses_parsed_config_until_file_changes(monkeypatch, tmp_path):
+    path = tmp_path / "services.json"
+    _write_config(path, [_service("svc-a")])
+    store = ConfigStore(str(path))
+    reads = _count_reads(monkeypatch, store)
+
+    assert [service.id for service in store.list_services()] == ["svc-a"]
+    assert [service.id for service in store.list_services()] == ["svc-a"]
+    assert len(reads) == 1
+
+    _write_config(path, [_service("svc-a"), _service("svc-b")])
+
+    assert [service.id for service in store.list_services()] == ["svc-a", "svc-b"]
+    assert len(reads) == 2
+
+
+def test_mutations_refresh_cache_without_rereading(monkeypatch, tmp_path):
+    path = tmp_path / "services.json"
+    _write_config(path, [_service("svc-a")])
+    store = ConfigStore(str(path))
+    store.list_services()
+    reads = _count_reads(monkeypatch, store)
+
+    store.create_service(_service("svc-b"))
+    with pytest.raises(ValueError):
+        store.create_service(_service("svc-b"))
+    toggled = store.toggle_service("svc-a")
+
+    assert toggled is not None and toggled.enabled is False
+    assert [(service.id, service.enabled) for service in store.list_services()] == [
+        ("svc-a", False),
+        ("svc-b", True),
+    ]
+    assert reads == []
+
+    on_disk = json.loads(path.read_text(encoding="utf-8"))
+    assert [service["id"] for service in on_disk["services"]] == ["svc-a", "svc-b"]
+    assert [entry.name for entry in tmp_path.iterdir()] == ["services.json"]
+
+
+def test_upsert_and_delete_keep_order_and_id_index_in_sync(tmp_path):
+    path = tmp_path / "services.json"
+    _write_config(path, [_service("svc-a"), _service("svc-b"), _service("svc-c")])
+    store = ConfigStore(str(path))
+
+    store.upsert_service(_service("svc-b", enabled=False))
+    store.upsert_service(_service("svc-d"))
+    removed = store.delete_service("svc-a")
+
+    assert removed is not None and removed.id == "svc-a"
+    assert store.delete_service("svc-a") is None
+    assert [(service.id, service.enabled) for service in store.list_services()] == [
+        ("svc-b", False),
+        ("svc-c", True),
+        ("svc-d", True),
+    ]
+    toggled = store.toggle_service("svc-d")
+    assert toggled is not None and toggled.enabled is False
+    assert [service.id for service in store.list_services()] == ["svc-b", "svc-c", "svc-d"]
+
+
+def test_list_services_reads_snapshot_without_waiting_for_writers(tmp_path):
+    path = tmp_path / "services.json"
+    _write_config(path, [_service("svc-a")])
+    store = ConfigStore(str(path))
+    store.list_services()
+
+    # A writer holding the lock must not block readers of an unchanged file.
+    with store._lock:
+        assert [service.id for service in store.list_services()] == ["svc-a"]
+
+
+def test_reads_document_and_bare_list_formats(tmp_path):
+    path = tmp_path / "services.json"
+    service_payload = _service("svc-a").model_dump(mode="json", exclude_none=True)
+
+    path.write_text(json.dumps({"version": 1, "services": [service_payload]}), encoding="utf-8")
+    assert [service.id for service in ConfigStore(str(path)).list_services()] == ["svc-a"]
+
+    path.write_text("\n" + json.dumps([service_payload]), encoding="utf-8")
+    assert [service.id for service in ConfigStore(str(path)).list_services()] == ["svc-a"]
+
+    path.write_text('"services"', encoding="utf-8")
+    with pytest.raises(ValueError):
+        ConfigStore(str(path)).list_services()
+
+
+def test_transaction_applies_several_edits_with_one_write(monkeypatch, tmp_path):
+    path = tmp_path / "services.json"
+    _write_config(path, [_service("svc-a"), _service("svc-b")])
+    store = ConfigStore(str(path))
+    writes: list[list[str]] = []
+    original_write = store._write_services_unlocked
+
+    def _counting_write(services):
+        writes.append([service.id for service in services])
+        original_write(services)
+
+    monkeypatch.setattr(store, "_write_services_unlocked", _counting_write)
+
+    with store.transaction() as txn:
+        txn.create(_service("svc-c"))
+        txn.delete("svc-a")
+        txn.toggle("svc-c")
+        txn.upsert(_service("svc-d"))
+
+    assert writes == [["svc-b", "svc-c", "svc-d"]]
+    assert [(service.id, service.enabled) for service in store.list_services()] == [
+        ("svc-b", True),
+        ("svc-c", False),
+        ("svc-d", True),
+    ]
+
+    with pytest.raises(ValueError):
+        with store.transaction() as txn:
+            txn.delete("svc-b")
+            txn.create(_service("svc-c"))
+    assert store.bulk_set_enabled(["svc-b"], True)[0].id == "svc-b"
+    assert len(writes) == 1
+    assert [service.id for service in store.list_services()] == ["svc-b", "svc-c", "svc-d"]
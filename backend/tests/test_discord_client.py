@@ -0,0 +1,27 @@
+import asyncio
+
+import httpx
+
+from app import http_client
+import app.discord_client as discord_client_module
+
+
+def test_post_answer_to_discord_does_not_replay_response_cookies(monkeypatch):
+    monkeypatch.setattr(discord_client_module, "DISCORD_BOT_TOKEN", "bot-token")
+    seen_cookies: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_cookies.append(request.headers.get("Cookie"))
+        return httpx.Response(200, json={"id": "1"}, headers={"Set-Cookie": "__cfruid=abc; Path=/"})
+
+    async def _run() -> list[bool]:
+        transport = httpx.MockTransport(_handler)
+        async with http_client._new_client(verify=True, transport=transport) as client:
+            monkeypatch.setattr(discord_client_module, "get_client", lambda: client)
+            return [
+                await discord_client_module.post_answer_to_discord(answer_text="First", thread_id="111"),
+                await discord_client_module.post_answer_to_discord(answer_text="Second", thread_id="222"),
+            ]
+
+    assert asyncio.run(_run()) == [True, True]
+    assert seen_cookies == [None, None]
@@ -1,17 +1,30 @@
 import logging
+import threading
+
+import pytest
 
 import app.ask_services.email as email_module
 
 
+@pytest.fixture(autouse=True)
+def _reset_smtp_session():
+    email_module.close_smtp_session()
+    yield
+    email_module.close_smtp_session()
+
+
 class _FakeSMTP:
     last_instance = None
 
-    def __init__(self, host, port):
+    def __init__(self, host, port, timeout=None):
         self.host = host
         self.port = port
+        self.timeout = timeout
         self.login_args = None
         self.sent_message = None
         self.starttls_called = False
+        self.sent_count = 0
+        self.quit_called = False
         _FakeSMTP.last_instance = self
 
     def __enter__(self):
@@ -31,6 +44,10 @@ class _FakeSMTP:
 
     def send_message(self, msg):
         self.sent_message = msg
+        self.sent_count += 1
+
+    def quit(self):
+        self.quit_called = True
 
 
 def test_send_custom_email_result_uses_smtp_user_for_auth_and_smtp_from_sender(monkeypatch, caplog):
@@ -60,7 +77,11 @@ def test_send_custom_email_result_uses_smtp_user_for_auth_and_smtp_from_sender(m
     assert smtp.login_args == ("icloud-user@example.com", "app-pass")
     assert smtp.sent_message is not None
     assert smtp.sent_message["From"] == "support@custom-domain.example"
+    html_part = smtp.sent_message.get_body(preferencelist=("html",))
+    assert html_part["Content-Transfer-Encoding"] == "7bit"
+    assert html_part.get_content().strip() == "<p>html body</p>"
     assert smtp.starttls_called is True
+    assert smtp.timeout == email_module.SMTP_TIMEOUT_SECONDS
 
     success_logs = [rec for rec in caplog.records if rec.message.startswith("ask_email_send_success")]
     assert success_logs
@@ -68,6 +89,97 @@ def test_send_custom_email_result_uses_smtp_user_for_auth_and_smtp_from_sender(m
     assert "42" in success_logs[0].message
 
 
+def test_send_custom_email_result_sends_long_ascii_html_as_quoted_printable(monkeypatch):
+    monkeypatch.setattr(email_module, "SMTP_HOST", "smtp.example.com")
+    monkeypatch.setattr(email_module, "SMTP_PORT", 587)
+    monkeypatch.setattr(email_module, "SMTP_USER", "icloud-user@example.com")
+    monkeypatch.setattr(email_module, "SMTP_PASS", "app-pass")
+    monkeypatch.setattr(email_module, "SMTP_FROM", "support@custom-domain.example")
+    monkeypatch.setattr(email_module, "SMTP_USE_TLS", True)
+    monkeypatch.setattr(email_module.smtplib, "SMTP", _FakeSMTP)
+    html_body = '<p style="color: #e5ecf5; margin: 0;">' + "x" * 120 + "</p>"
+
+    ok, error = email_module.send_custom_email_result(
+        to_email="recipient@example.com",
+        subject="Test Subject",
+        text_body="plain body",
+        html_body=html_body,
+        question_id=43,
+        log_context="unit_test",
+    )
+
+    assert ok is True
+    assert error is None
+    html_part = _FakeSMTP.last_instance.sent_message.get_body(preferencelist=("html",))
+    assert html_part["Content-Transfer-Encoding"] == "quoted-printable"
+    assert html_part.get_content().strip() == html_body
+
+
+def test_send_custom_email_result_reuses_smtp_session(monkeypatch):
+    monkeypatch.setattr(email_module, "SMTP_HOST", "smtp.example.com")
+    monkeypatch.setattr(email_module, "SMTP_PORT", 587)
+    monkeypatch.setattr(email_module, "SMTP_USER", "icloud-user@example.com")
+    monkeypatch.setattr(email_module, "SMTP_PASS", "app-pass")
+    monkeypatch.setattr(email_module, "SMTP_FROM", "support@custom-domain.example")
+    monkeypatch.setattr(email_module, "SMTP_USE_TLS", True)
+    monkeypatch.setattr(email_module.smtplib, "SMTP", _FakeSMTP)
+
+    for question_id in (1, 2):
+        ok, _error = email_module.send_custom_email_result(
+            to_email="recipient@example.com",
+            subject="Test Subject",
+            text_body="plain body",
+            html_body="<p>html body</p>",
+            question_id=question_id,
+        )
+        assert ok is True
+        if question_id == 1:
+            first_session = _FakeSMTP.last_instance
+
+    assert _FakeSMTP.last_instance is first_session
+    assert first_session.sent_count == 2
+
+    email_module.close_smtp_session()
+    assert first_session.quit_called is True
+
+
+def test_send_custom_email_result_reconnects_when_pooled_session_is_stale(monkeypatch):
+    instances = []
+
+    class _IdleTimeoutSMTP(_FakeSMTP):
+        def __init__(self, host, port, timeout=None):
+            super().__init__(host, port, timeout=timeout)
+            instances.append(self)
+
+        def send_message(self, msg):
+            if self is instances[0] and self.sent_count == 1:
+                raise email_module.smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+            super().send_message(msg)
+
+    monkeypatch.setattr(email_module, "SMTP_HOST", "smtp.example.com")
+    monkeypatch.setattr(email_module, "SMTP_PORT", 587)
+    monkeypatch.setattr(email_module, "SMTP_USER", "icloud-user@example.com")
+    monkeypatch.setattr(email_module, "SMTP_PASS", "app-pass")
+    monkeypatch.setattr(email_module, "SMTP_FROM", "support@custom-domain.example")
+    monkeypatch.setattr(email_module, "SMTP_USE_TLS", True)
+    monkeypatch.setattr(email_module.smtplib, "SMTP", _IdleTimeoutSMTP)
+
+    for question_id in (1, 2):
+        ok, error = email_module.send_custom_email_result(
+            to_email="recipient@example.com",
+            subject="Test Subject",
+            text_body="plain body",
+            html_body="<p>html body</p>",
+            question_id=question_id,
+        )
+        assert ok is True
+        assert error is None
+
+    assert len(instances) == 2
+    assert instances[0].quit_called is True
+    assert instances[1].sent_count == 1
+
+
 def test_send_custom_email_result_logs_failure_with_stacktrace(monkeypatch, caplog):
     class _BoomSMTP(_FakeSMTP):
         def send_message(self, msg):
@@ -98,3 +210,64 @@ def test_send_custom_email_result_logs_failure_with_stacktrace(monkeypatch, capl
     assert failure_logs
     assert failure_logs[0].exc_info is not None
 
+
+def test_send_answer_email_escapes_user_content_in_html(monkeypatch):
+    captured = {}
+
+    def _fake_send_custom_email(**kwargs):
+        captured.update(kwargs)
+        return True
+
+    monkeypatch.setattr(email_module, "send_custom_email", _fake_send_custom_email)
+
+    ok = email_module.send_answer_email(
+        to_email="recipient@example.com",
+        to_name="<b>Eve</b>",
+        question_text="Is <script>alert(1)</script> safe?",
+        answer_text="Line one\nLine two & more",
+        question_id=7,
+    )
+
+    assert ok is True
+    assert "<script>" not in captured["html_body"]
+    assert "&lt;script&gt;" in captured["html_body"]
+    assert "Hi &lt;b&gt;Eve&lt;/b&gt;," in captured["html_body"]
+    assert "Line one<br>Line two &amp; more" in captured["html_body"]
+    assert "Line one\nLine two & more" in captured["text_body"]
+
+
+def test_smtp_executor_threads_each_keep_their_own_session(monkeypatch):
+    monkeypatch.setattr(email_module, "SMTP_HOST", "smtp.example.com")
+    monkeypatch.setattr(email_module, "SMTP_PORT", 587)
+    monkeypatch.setattr(email_module, "SMTP_USER", "icloud-user@example.com")
+    monkeypatch.setattr(email_module, "SMTP_PASS", "app-pass")
+    monkeypatch.setattr(email_module, "SMTP_FROM", "support@custom-domain.example")
+    monkeypatch.setattr(email_module, "SMTP_USE_TLS", True)
+    monkeypatch.setattr(email_module.smtplib, "SMTP", _FakeSMTP)
+
+    def _send_from_new_thread():
+        result = {}
+        worker = threading.Thread(
+            target=lambda: result.update(
+                ok=email_module.send_custom_email(
+                    to_email="recipient@example.com",
+                    subject="Test Subject",
+                    text_body="plain body",
+                    html_body="<p>html body</p>",
+                ),
+                smtp=_FakeSMTP.last_instance,
+            )
+        )
+        worker.start()
+        worker.join()
+        return result
+
+    first = _send_from_new_thread()
+    second = _send_from_new_thread()
+
+    assert first["ok"] is True and second["ok"] is True
+    assert first["smtp"] is not second["smtp"]
+
+    email_module.close_smtp_session()
+    assert first["smtp"].quit_called is True
+    assert second["smtp"].quit_called is True
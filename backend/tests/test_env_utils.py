@@ -0,0 +1,31 @@
+import os
+from pathlib import Path
+
+from app.env_utils import get_env
+
+
+def test_get_env_reads_secret_file_once_until_it_changes(monkeypatch, tmp_path):
+    secret_path = tmp_path / "token"
+    secret_path.write_text("first-secret\n", encoding="utf-8")
+    monkeypatch.delenv("ENV_UTILS_TOKEN", raising=False)
+    monkeypatch.setenv("ENV_UTILS_TOKEN_FILE", str(secret_path))
+    reads: list[Path] = []
+    original_read_text = Path.read_text
+
+    def _counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _counting_read_text)
+
+    assert get_env("ENV_UTILS_TOKEN") == "first-secret"
+    assert get_env("ENV_UTILS_TOKEN") == "first-secret"
+    assert len(reads) == 1
+
+    secret_path.write_text("rotated-secret-value\n", encoding="utf-8")
+    os.utime(secret_path, ns=(0, 1_000_000_000))
+    assert get_env("ENV_UTILS_TOKEN") == "rotated-secret-value"
+    assert len(reads) == 2
+
+    monkeypatch.setenv("ENV_UTILS_TOKEN", "from-env")
+    assert get_env("ENV_UTILS_TOKEN") == "from-env"
@@ -0,0 +1,30 @@
+import pytest
+
+from app import fs_utils
+from app.fs_utils import atomic_write_bytes
+
+
+@pytest.mark.parametrize("use_tmpfile", [True, False])
+def test_atomic_write_bytes_replaces_file_without_leftovers(monkeypatch, tmp_path, use_tmpfile):
+    if not use_tmpfile:
+        monkeypatch.setattr(fs_utils, "_O_TMPFILE", None)
+    target = tmp_path / "data.json"
+    target.write_bytes(b"old")
+
+    atomic_write_bytes(target, b"new contents")
+
+    assert target.read_bytes() == b"new contents"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_config_store_only_syncs_when_opted_in(monkeypatch, tmp_path):
+    from app.config_store import ConfigStore
+
+    synced: list[int] = []
+    monkeypatch.setattr(fs_utils, "_datasync", synced.append)
+
+    ConfigStore(str(tmp_path / "fast.json"))
+    assert synced == []
+
+    ConfigStore(str(tmp_path / "durable.json"), fsync=True)
+    assert len(synced) == 1
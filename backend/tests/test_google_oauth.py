@@ -0,0 +1,30 @@
+import asyncio
+
+import httpx
+
+from app import http_client
+import app.ask_services.google_oauth as google_oauth_module
+
+
+def test_token_exchange_and_userinfo_do_not_share_cookies(monkeypatch):
+    seen_cookies: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_cookies.append(request.headers.get("Cookie"))
+        if request.url.path.endswith("/token"):
+            return httpx.Response(
+                200,
+                json={"access_token": "access-1"},
+                headers={"Set-Cookie": "NID=abc; Domain=googleapis.com; Path=/"},
+            )
+        return httpx.Response(200, json={"email": "user@example.com"})
+
+    async def _run() -> dict:
+        transport = httpx.MockTransport(_handler)
+        async with http_client._new_client(verify=True, transport=transport) as client:
+            monkeypatch.setattr(google_oauth_module, "get_client", lambda: client)
+            tokens = await google_oauth_module.exchange_code("code-1", "https://example.test/callback")
+            return await google_oauth_module.get_user_info(tokens["access_token"])
+
+    assert asyncio.run(_run()) == {"email": "user@example.com"}
+    assert seen_cookies == [None, None]
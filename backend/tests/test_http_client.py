@@ -0,0 +1,45 @@
+import asyncio
+
+import httpx
+
+from app import http_client
+
+
+def test_new_event_loop_closes_clients_from_previous_loop():
+    async def _first():
+        return http_client.get_client(verify=True)
+
+    async def _second():
+        client = http_client.get_client(verify=True)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return client
+
+    try:
+        old_client = asyncio.run(_first())
+        new_client = asyncio.run(_second())
+
+        assert new_client is not old_client
+        assert old_client.is_closed
+        assert not new_client.is_closed
+    finally:
+        asyncio.run(http_client.close_clients())
+
+
+def test_shared_client_does_not_send_cookies_from_earlier_responses():
+    seen_cookies = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_cookies.append(request.headers.get("Cookie"))
+        return httpx.Response(200, headers={"Set-Cookie": "sid=abc; Path=/"})
+
+    async def _run():
+        async with http_client._new_client(verify=True, transport=httpx.MockTransport(_handler)) as client:
+            await client.get("https://example.test/first")
+            await client.get("https://example.test/second")
+            return len(client.cookies.jar)
+
+    stored = asyncio.run(_run())
+
+    assert seen_cookies == [None, None]
+    assert stored == 0
@@ -1,5 +1,10 @@
+import asyncio
+
+import httpx
 import pytest
 
+from app import http_client
+import app.ask_services.llm_client as llm_client_module
 from app.ask_services.llm_client import LLMClientError, _normalize_messages, build_chat_completion_urls
 
 
@@ -41,3 +46,69 @@ def test_normalize_messages_moves_system_to_front():
 def test_normalize_messages_requires_system():
     with pytest.raises(LLMClientError):
         _normalize_messages([{"role": "user", "content": "Question"}])
+
+
+def test_call_openai_compatible_falls_back_and_remembers_working_url(monkeypatch):
+    requested: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        if request.url.path == "/engines/v1/chat/completions":
+            return httpx.Response(404, content=b"x" * (llm_client_module._ERROR_BODY_READ_LIMIT * 4))
+        return httpx.Response(200, json={"choices": [{"message": {"content": " Restart the app. "}}]})
+
+    monkeypatch.setattr(llm_client_module, "_working_urls", {})
+
+    async def _run() -> list[str]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            monkeypatch.setattr(llm_client_module, "get_client", lambda: client)
+            answers = []
+            for _ in range(2):
+                answers.append(
+                    await llm_client_module.call_openai_compatible(
+                        base_url="http://172.16.2.220:12434/engines/v1",
+                        api_key=None,
+                        model="ai/llama3.2:latest",
+                        messages=[{"role": "system", "content": "rules"}, {"role": "user", "content": "Question"}],
+                        timeout_seconds=5,
+                    )
+                )
+            return answers
+
+    assert asyncio.run(_run()) == ["Restart the app.", "Restart the app."]
+    # The second call goes straight to the candidate that worked.
+    assert requested == [
+        "http://172.16.2.220:12434/engines/v1/chat/completions",
+        "http://172.16.2.220:12434/v1/chat/completions",
+        "http://172.16.2.220:12434/v1/chat/completions",
+    ]
+
+
+def test_call_openai_compatible_does_not_replay_response_cookies(monkeypatch):
+    seen_cookies: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_cookies.append(request.headers.get("Cookie"))
+        return httpx.Response(
+            200,
+            json={"choices": [{"message": {"content": "ok"}}]},
+            headers={"Set-Cookie": "sid=abc; Path=/"},
+        )
+
+    monkeypatch.setattr(llm_client_module, "_working_urls", {})
+
+    async def _run() -> None:
+        transport = httpx.MockTransport(_handler)
+        async with http_client._new_client(verify=True, transport=transport) as client:
+            monkeypatch.setattr(llm_client_module, "get_client", lambda: client)
+            for _ in range(2):
+                await llm_client_module.call_openai_compatible(
+                    base_url="http://172.16.2.220:12434/v1",
+                    api_key=None,
+                    model="ai/llama3.2:latest",
+                    messages=[{"role": "system", "content": "rules"}, {"role": "user", "content": "Question"}],
+                    timeout_seconds=5,
+                )
+
+    asyncio.run(_run())
+    assert seen_cookies == [None, None]
@@ -1,6 +1,7 @@
 import asyncio
 
 import app.ask_services.llm as llm_module
+from app.async_utils import LoopSemaphore
 
 
 def test_security_prompts_are_blocked_before_llm_call(monkeypatch):
@@ -72,3 +73,36 @@ def test_system_prompt_first_and_temperature_applied(monkeypatch):
     assert isinstance(messages, list) and messages
     assert messages[0]["role"] == "system"
     assert "Marc's private assistant" in messages[0]["content"]
+
+
+def test_local_llm_calls_respect_concurrency_limit(monkeypatch):
+    state = {"active": 0, "peak": 0}
+
+    async def _fake_call(**_kwargs):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return "Try restarting the app."
+
+    monkeypatch.setattr(llm_module, "call_openai_compatible", _fake_call)
+    monkeypatch.setattr(llm_module, "_local_llm_semaphore", LoopSemaphore(2))
+
+    async def _run() -> list[str]:
+        return await asyncio.gather(
+            *(llm_module.generate_local_answer_text("How can I debug this crash?") for _ in range(5))
+        )
+
+    responses = asyncio.run(_run())
+
+    assert responses == ["Try restarting the app."] * 5
+    assert state["peak"] == 2
+
+
+def test_overlong_questions_are_blocked_without_scanning():
+    limit = llm_module.MAX_QUESTION_CHARS
+    # A long but harmless question from the Discord path must still be answered.
+    assert llm_module.looks_like_injection("How do I restart Plex? " * 250) is False
+
+    assert llm_module.looks_like_injection("a" * limit) is False
+    assert llm_module.looks_like_injection("a" * (limit + 1)) is True
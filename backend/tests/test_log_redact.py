@@ -1,5 +1,7 @@
 import logging
+import sys
 
+import app.log_redact as log_redact_module
 from app.log_redact import SecretRedactionFilter, redact_text, redact_url
 
 
@@ -29,6 +31,12 @@ def test_redact_text_masks_url_bearer_and_key_value_patterns():
     assert "zzzz" not in redacted
 
 
+def test_redact_text_later_passes_see_earlier_output():
+    assert redact_text("Bearer key: v") == "Bearer ***: ***"
+    assert redact_text('{"secret": "abc"} http://example.test/x?token=1') == '{"secret": "***"} http://example.test/x?token=***'
+    assert redact_text("plain status line") == "plain status line"
+
+
 def test_secret_redaction_filter_sanitizes_formatted_message():
     record = logging.LogRecord(
         name="unit-test",
@@ -45,3 +53,45 @@ def test_secret_redaction_filter_sanitizes_formatted_message():
     assert "apikey=***" in record.msg
     assert "plain-secret" not in record.msg
     assert record.args == ()
+
+
+def test_secret_redaction_filter_formats_traceback_once(monkeypatch):
+    calls: list[int] = []
+    original_format = log_redact_module.traceback.format_exception
+
+    def _counting_format(*args, **kwargs):
+        calls.append(1)
+        return original_format(*args, **kwargs)
+
+    monkeypatch.setattr(log_redact_module.traceback, "format_exception", _counting_format)
+    try:
+        raise RuntimeError("failed with token=abc123")
+    except RuntimeError:
+        record = logging.LogRecord("unit-test", logging.ERROR, __file__, 10, "boom", (), sys.exc_info())
+
+    filter_instance = SecretRedactionFilter()
+    for _ in range(3):
+        assert filter_instance.filter(record) is True
+
+    assert len(calls) == 1
+    assert "token=***" in record.exc_text
+    assert "abc123" not in record.exc_text
+
+
+def test_secret_redaction_filter_redacts_each_record_once(monkeypatch):
+    calls: list[str] = []
+    original_redact = log_redact_module.redact_text
+
+    def _counting_redact(value):
+        calls.append(value)
+        return original_redact(value)
+
+    monkeypatch.setattr(log_redact_module, "redact_text", _counting_redact)
+    record = logging.LogRecord("unit-test", logging.INFO, __file__, 10, "key=%s", ("secret-value",), None)
+
+    filter_instance = SecretRedactionFilter()
+    for _ in range(3):
+        assert filter_instance.filter(record) is True
+
+    assert calls == ["key=secret-value"]
+    assert record.getMessage() == "key=***"
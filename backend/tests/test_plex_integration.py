@@ -0,0 +1,174 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app import http_client
+import app.integrations.plex as plex_module
+from app.models import ServiceConfig, ServiceGroup, Status
+
+SESSIONS_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<MediaContainer size="2">
+  <Video title="Episode 1" grandparentTitle="Show" parentTitle="Season 1" viewOffset="1000" duration="60000">
+    <User title="alice" />
+    <Player title="Living Room" state="playing" />
+  </Video>
+  <Track title=" " grandparentTitle="Artist" duration="abc">
+    <Player product="Plexamp" state="paused" />
+  </Track>
+</MediaContainer>
+"""
+
+
+@pytest.fixture(autouse=True)
+def _debug_flag_from_env(monkeypatch):
+    # The flag is cached per process; start each test from a clean env read.
+    monkeypatch.delenv("DEBUG_PLEX_SESSIONS", raising=False)
+    plex_module._debug_plex_sessions_enabled.cache_clear()
+    yield
+    plex_module._debug_plex_sessions_enabled.cache_clear()
+
+
+def _plex_service() -> ServiceConfig:
+    return ServiceConfig(
+        id="plex",
+        name="Plex",
+        group=ServiceGroup.MEDIA,
+        url="https://plex.example.test/",
+        check_type="plex",
+    )
+
+
+def _run_check(monkeypatch, handler) -> tuple:
+    async def _run():
+        transport = httpx.MockTransport(handler)
+        async with http_client._new_client(verify=True, transport=transport) as client:
+            monkeypatch.setattr(plex_module, "get_client", lambda *, verify: client)
+            return await plex_module.check_plex_service(_plex_service())
+
+    return asyncio.run(_run())
+
+
+def test_check_plex_service_reports_now_playing(monkeypatch):
+    monkeypatch.setenv("PLEX_TOKEN", "plex-secret")
+    requested: list[httpx.URL] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url)
+        if request.url.path == "/identity":
+            return httpx.Response(200, text="<MediaContainer />")
+        return httpx.Response(200, text=SESSIONS_XML, headers={"content-type": "text/xml"})
+
+    status = _run_check(monkeypatch, _handler)
+
+    assert status.status == Status.HEALTHY
+    assert [url.path for url in requested] == ["/identity", "/status/sessions"]
+    assert all(dict(url.params) == {"X-Plex-Token": "plex-secret"} for url in requested)
+    assert status.extra["identity_ok"] is True
+    assert status.extra["sessions_parse_count"] == 2
+    assert status.extra["now_playing"] == [
+        {
+            "type": "video",
+            "title": "Episode 1",
+            "grandparent": "Show",
+            "parent": "Season 1",
+            "user": "alice",
+            "player": "Living Room",
+            "state": "playing",
+            "view_offset_ms": 1000,
+            "duration_ms": 60000,
+        },
+        {
+            "type": "track",
+            "title": "Artist",
+            "grandparent": "Artist",
+            "parent": None,
+            "user": None,
+            "player": "Plexamp",
+            "state": "paused",
+            "view_offset_ms": None,
+            "duration_ms": None,
+        },
+    ]
+
+
+def test_check_plex_service_flags_auth_failure(monkeypatch):
+    monkeypatch.setenv("PLEX_TOKEN", "plex-secret")
+
+    status = _run_check(monkeypatch, lambda request: httpx.Response(401))
+
+    assert status.status == Status.UNKNOWN
+    assert status.extra["auth_ok"] is False
+    assert status.extra["now_playing"] == []
+
+
+def test_check_plex_service_does_not_replay_identity_cookies(monkeypatch):
+    monkeypatch.setenv("PLEX_TOKEN", "plex-secret")
+    seen_cookies: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen_cookies.append(request.headers.get("Cookie"))
+        if request.url.path == "/identity":
+            return httpx.Response(200, text="<MediaContainer />", headers={"Set-Cookie": "sid=abc; Path=/"})
+        return httpx.Response(200, text=SESSIONS_XML, headers={"content-type": "text/xml"})
+
+    status = _run_check(monkeypatch, _handler)
+
+    assert status.status == Status.HEALTHY
+    assert seen_cookies == [None, None]
+
+
+def test_check_plex_service_adds_session_diagnostics_when_debug_enabled(monkeypatch):
+    monkeypatch.setenv("PLEX_TOKEN", "plex-secret")
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/identity":
+            return httpx.Response(200, text="<MediaContainer />")
+        return httpx.Response(200, text=SESSIONS_XML, headers={"content-type": "text/xml"})
+
+    status = _run_check(monkeypatch, _handler)
+    assert "sessions_root_tag" not in status.extra
+
+    monkeypatch.setenv("DEBUG_PLEX_SESSIONS", "true")
+    plex_module._debug_plex_sessions_enabled.cache_clear()
+    status = _run_check(monkeypatch, _handler)
+    assert status.extra["sessions_root_tag"] == "MediaContainer"
+    assert status.extra["sessions_content_type"] == "text/xml"
+
+
+def test_redact_plex_token_covers_whole_token():
+    redacted = plex_module._redact_plex_token('<a href="/x?X-Plex-Token=abcSecret123&y=1">')
+    assert redacted == '<a href="/x?X-Plex-Token=REDACTED&y=1">'
+
+
+def test_check_plex_service_keeps_sessions_when_identity_times_out(monkeypatch):
+    monkeypatch.setenv("PLEX_TOKEN", "plex-secret")
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/identity":
+            raise httpx.ConnectTimeout("timed out", request=request)
+        return httpx.Response(200, text=SESSIONS_XML)
+
+    status = _run_check(monkeypatch, _handler)
+
+    assert status.status == Status.UNKNOWN
+    assert status.extra["identity_ok"] is False
+    assert status.extra["sessions_ok"] is True
+    assert status.extra["sessions_parse_count"] == 2
+    assert status.extra["sessions_error_class"] == "TimeoutException"
+
+
+def test_check_plex_service_skips_sessions_when_identity_is_rejected(monkeypatch):
+    monkeypatch.setenv("PLEX_TOKEN", "plex-secret")
+    requested: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        return httpx.Response(401)
+
+    status = _run_check(monkeypatch, _handler)
+
+    assert requested == ["/identity"]
+    assert status.extra["auth_ok"] is False
+    assert status.extra["sessions_ok"] is False
+    assert status.extra["sessions_http_status"] is None
@@ -1,10 +1,12 @@
 import asyncio
 from datetime import datetime
+from types import SimpleNamespace
 
 from fastapi.testclient import TestClient
 
 from app.main import app
 from app.models import ServiceConfig, ServiceGroup
+from app.services import clear_check_cache
 from app.state import state
 import app.main as main_module
 
@@ -54,6 +56,7 @@ def _service(service_id: str = "svc-a", enabled: bool = True) -> ServiceConfig:
 
 
 def _reset_state() -> None:
+    clear_check_cache()
     asyncio.run(state.clear_cached_payload())
 
 
@@ -99,6 +102,31 @@ def test_status_serves_cached_payload_without_rebuilding(monkeypatch):
     assert payload["generated_at"].startswith("2026-02-07T00:00:00")
 
 
+def test_status_checks_within_ttl_reuse_cached_result(monkeypatch):
+    monkeypatch.setattr(main_module, "config_store", FakeConfigStore([_service()]))
+    monkeypatch.setattr(main_module.config, "CHECK_CACHE_TTL_SECONDS", 60.0)
+
+    calls = []
+
+    class CountingClient:
+        async def get(self, *args, **kwargs):
+            calls.append(args)
+            return SimpleNamespace(status_code=200)
+
+    fake_client = CountingClient()
+    monkeypatch.setattr("app.services.get_client", lambda *, verify: fake_client)
+
+    _reset_state()
+
+    async def _refresh_twice():
+        return await asyncio.gather(main_module._refresh_once(), main_module._refresh_once())
+
+    asyncio.run(_refresh_twice())
+    payload, *_ = asyncio.run(main_module._refresh_once())
+    assert payload["services"][0]["status"] == "healthy"
+    assert len(calls) == 1
+
+
 def test_status_hides_service_urls_when_not_exposed(monkeypatch):
     monkeypatch.setattr(main_module, "config_store", FakeConfigStore([_service()]))
     monkeypatch.setattr(main_module.config, "EXPOSE_SERVICE_URLS", False)